@@ -5,6 +5,8 @@ from django.shortcuts import redirect, render
 from django.utils import translation
 from django.utils.translation import gettext as _
 
+from translations.queue import enqueue_user_lists
+
 from .forms import LanguagePreferenceForm
 
 
@@ -14,6 +16,8 @@ def profile(request):
         form = LanguagePreferenceForm(request.POST, instance=request.user)
         if form.is_valid():
             user = form.save()
+            if "preferred_language" in form.changed_data:
+                enqueue_user_lists(user)
             # Activate the new UI language immediately
             translation.activate(user.ui_language)
             messages.success(request, _("Your profile has been saved."))
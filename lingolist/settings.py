@@ -122,8 +122,23 @@ TEMPLATES = [
             ],
         },
     },
+    {
+        # Ports of the hot HTMX partials only; see PARTIALS_TEMPLATE_ENGINE.
+        "BACKEND": "django.template.backends.jinja2.Jinja2",
+        "NAME": "jinja2",
+        "DIRS": [BASE_DIR / "templates" / "jinja2"],
+        "APP_DIRS": False,
+        "OPTIONS": {
+            "environment": "lingolist.jinja2.environment",
+            "keep_trailing_newline": True,
+        },
+    },
 ]
 
+# Template engine ("django" or "jinja2") rendering the item row, item list
+# and collaborator list partials returned by the HTMX views.
+PARTIALS_TEMPLATE_ENGINE = os.environ.get("PARTIALS_TEMPLATE_ENGINE", "django")
+
 WSGI_APPLICATION = "lingolist.wsgi.application"
 
 # ---------------------------------------------------------------------------
@@ -149,6 +164,21 @@ else:
         }
     }
 
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+# Defaults to a per-process in-memory cache. Point it at a shared backend
+# (e.g. django.core.cache.backends.redis.RedisCache) in multi-worker setups.
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", ""),
+    }
+}
+
 # ---------------------------------------------------------------------------
 # Auth
 # ---------------------------------------------------------------------------
@@ -238,6 +268,97 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # ---------------------------------------------------------------------------
 
 LIBRETRANSLATE_URL = os.environ.get("LIBRETRANSLATE_URL", "http://localhost:5000")
+# Maximum number of strings sent in a single array-form /translate request.
+LIBRETRANSLATE_BATCH_SIZE = int(os.environ.get("LIBRETRANSLATE_BATCH_SIZE", "50"))
+# Pooled keep-alive transport: connections kept open per process, split
+# connect/read timeouts (seconds) and retry policy for transient failures.
+LIBRETRANSLATE_POOL_SIZE = int(os.environ.get("LIBRETRANSLATE_POOL_SIZE", "10"))
+LIBRETRANSLATE_CONNECT_TIMEOUT = float(os.environ.get("LIBRETRANSLATE_CONNECT_TIMEOUT", "3"))
+LIBRETRANSLATE_READ_TIMEOUT = float(os.environ.get("LIBRETRANSLATE_READ_TIMEOUT", "10"))
+LIBRETRANSLATE_MAX_RETRIES = int(os.environ.get("LIBRETRANSLATE_MAX_RETRIES", "2"))
+LIBRETRANSLATE_BACKOFF_FACTOR = float(os.environ.get("LIBRETRANSLATE_BACKOFF_FACTOR", "0.25"))
+LIBRETRANSLATE_BACKOFF_JITTER = float(os.environ.get("LIBRETRANSLATE_BACKOFF_JITTER", "0.25"))
+# Circuit breaker (per backend and per language pair): open after this many
+# consecutive failures, then allow a probe request after the reset timeout.
+LIBRETRANSLATE_CIRCUIT_THRESHOLD = int(os.environ.get("LIBRETRANSLATE_CIRCUIT_THRESHOLD", "5"))
+LIBRETRANSLATE_CIRCUIT_RESET_TIMEOUT = float(os.environ.get("LIBRETRANSLATE_CIRCUIT_RESET_TIMEOUT", "30"))
+# Failed (text, pair) combinations are not retried for this many seconds.
+TRANSLATION_NEGATIVE_CACHE_TTL = float(os.environ.get("TRANSLATION_NEGATIVE_CACHE_TTL", "60"))
+TRANSLATION_NEGATIVE_CACHE_MAX_ENTRIES = int(os.environ.get("TRANSLATION_NEGATIVE_CACHE_MAX_ENTRIES", "10000"))
+# Pending rows are translated and streamed to the browser this many at a time.
+TRANSLATION_STREAM_CHUNK_SIZE = int(os.environ.get("TRANSLATION_STREAM_CHUNK_SIZE", "10"))
+
+# Seconds a user's cached list access map is kept (it is also replaced as
+# soon as the user's memberships change). A per-process cache does not see
+# other workers' changes, so the default is short there.
+LIST_ACCESS_CACHE_TTL = int(
+    os.environ.get(
+        "LIST_ACCESS_CACHE_TTL",
+        "10" if CACHES["default"]["BACKEND"].endswith("LocMemCache") else "300",
+    )
+)
+
+# Lists shown per page (and per infinite-scroll batch) on the list overviews.
+LIST_INDEX_PAGE_SIZE = int(os.environ.get("LIST_INDEX_PAGE_SIZE", "30"))
+
+# Items rendered per window on the list page; more load as the user scrolls.
+LIST_ITEM_WINDOW_SIZE = int(os.environ.get("LIST_ITEM_WINDOW_SIZE", "100"))
+
+# Per-process cache of rendered item rows (see lists.fragments); 0 entries
+# disables it.
+ITEM_ROW_CACHE_MAX_ENTRIES = int(os.environ.get("ITEM_ROW_CACHE_MAX_ENTRIES", "50000"))
+ITEM_ROW_CACHE_MAX_BYTES = int(os.environ.get("ITEM_ROW_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+ITEM_ROW_CACHE_TTL = float(os.environ.get("ITEM_ROW_CACHE_TTL", "3600"))
+
+# Seconds between polls of the list page for collaborators' changes.
+LIST_CHANGES_POLL_INTERVAL = int(os.environ.get("LIST_CHANGES_POLL_INTERVAL", "5"))
+
+# How list pages learn about collaborators' changes: "auto" (PostgreSQL
+# LISTEN/NOTIFY, or polling the change log on other databases), "postgres",
+# "polling", "local" (single process only) or "off" (pages poll instead).
+LIST_EVENTS_BACKEND = os.environ.get("LIST_EVENTS_BACKEND", "auto")
+# Seconds between change log polls (polling backend) or reconnect attempts
+# (postgres backend); one query per process, whatever the number of pages.
+LIST_EVENTS_POLL_INTERVAL = float(os.environ.get("LIST_EVENTS_POLL_INTERVAL", "1"))
+# Seconds between keep-alive comments, and before a stream is closed (the
+# browser reconnects).
+LIST_EVENTS_KEEPALIVE = float(os.environ.get("LIST_EVENTS_KEEPALIVE", "15"))
+LIST_EVENTS_MAX_AGE = float(os.environ.get("LIST_EVENTS_MAX_AGE", "300"))
+# Streams (list events and translations) one process serves at a time; each
+# holds a thread. Keep it well below gunicorn's --threads (32 in the image) so
+# ordinary requests always find one; pages beyond the limit poll instead.
+LIST_EVENTS_MAX_STREAMS = int(os.environ.get("LIST_EVENTS_MAX_STREAMS", "16"))
+
+# Seconds list change log entries are kept by compact_list_changes; pages
+# older than that reload their items instead of replaying changes.
+LIST_CHANGE_RETENTION = int(os.environ.get("LIST_CHANGE_RETENTION", "86400"))
+
+# Item rank keys longer than this trigger a resequence of the list.
+LIST_RANK_MAX_LENGTH = int(os.environ.get("LIST_RANK_MAX_LENGTH", "16"))
+
+# The in-memory language pair index is rebuilt when LanguagePair changes, or
+# at the latest after this many seconds.
+LANGUAGE_INDEX_MAX_AGE = float(os.environ.get("LANGUAGE_INDEX_MAX_AGE", "300"))
+
+# Translation lookups: per-process LRU (entries / bytes / seconds) in front
+# of the TranslationCache table, plus an optional shared tier using the
+# named CACHES alias (disabled when unset).
+TRANSLATION_CACHE_LRU_MAX_ENTRIES = int(os.environ.get("TRANSLATION_CACHE_LRU_MAX_ENTRIES", "20000"))
+TRANSLATION_CACHE_LRU_MAX_BYTES = int(os.environ.get("TRANSLATION_CACHE_LRU_MAX_BYTES", str(8 * 1024 * 1024)))
+TRANSLATION_CACHE_LRU_TTL = float(os.environ.get("TRANSLATION_CACHE_LRU_TTL", "600"))
+TRANSLATION_CACHE_ALIAS = os.environ.get("TRANSLATION_CACHE_ALIAS") or None
+TRANSLATION_CACHE_SHARED_TTL = int(os.environ.get("TRANSLATION_CACHE_SHARED_TTL", "86400"))
+# Retention: compact_translation_cache keeps at most this many cache rows
+# (0 = unbounded). Last-access times are written in batches of
+# TRANSLATION_ACCESS_FLUSH_SIZE or every TRANSLATION_ACCESS_FLUSH_INTERVAL seconds.
+TRANSLATION_CACHE_MAX_ROWS = int(os.environ.get("TRANSLATION_CACHE_MAX_ROWS", "500000"))
+TRANSLATION_ACCESS_FLUSH_SIZE = int(os.environ.get("TRANSLATION_ACCESS_FLUSH_SIZE", "500"))
+TRANSLATION_ACCESS_FLUSH_INTERVAL = float(os.environ.get("TRANSLATION_ACCESS_FLUSH_INTERVAL", "60"))
+# Identical concurrent translation batches (job worker, cache warming and
+# translation streams) share one API call: other workers wait up to this many
+# seconds on the leader's lease, polling for its result.
+TRANSLATION_LEASE_TIMEOUT = float(os.environ.get("TRANSLATION_LEASE_TIMEOUT", "15"))
+TRANSLATION_LEASE_POLL_INTERVAL = float(os.environ.get("TRANSLATION_LEASE_POLL_INTERVAL", "0.2"))
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -0,0 +1,129 @@
+"""Resolve which lists a user may open, with as few queries as possible.
+
+Each user's accessible lists are cached as ``{list_id: role}`` in the default
+cache under a per-user membership version.  The version is replaced whenever
+the user gains or loses a list (see ``lists.signals``), so stale entries are
+never read and simply expire.  With a shared cache backend all workers see
+the change at once; with a per-process cache (``LocMemCache``) other workers
+keep their map until ``LIST_ACCESS_CACHE_TTL`` runs out.  Requests that
+modify a list therefore always confirm the role in the database, while pages
+and item windows may still be shown to a removed collaborator for up to that
+long.  Change streams outlive any cache entry and check membership in the
+database when they open and on every wake-up (``member_list_version``).
+"""
+
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, Exists, OuterRef, Q, Value
+from django.shortcuts import get_object_or_404
+
+from .models import Collaborator, List
+
+OWNER = "owner"
+COLLABORATOR = "collaborator"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def _version_key(user_id) -> str:
+    return f"lists:membership:{user_id}:version"
+
+
+def _access_key(user_id) -> str:
+    return f"lists:access:{user_id}:{membership_version(user_id)}"
+
+
+def membership_version(user_id) -> str:
+    """Return the current membership version stamp of a user."""
+    return cache.get_or_set(_version_key(user_id), uuid.uuid4().hex, timeout=None)
+
+
+def bump_membership_version(*user_ids) -> None:
+    """Invalidate the cached access of every user in *user_ids*."""
+    cache.set_many({_version_key(user_id): uuid.uuid4().hex for user_id in user_ids}, timeout=None)
+
+
+def membership_roles(user):
+    """Return ``(list_id, role)`` rows for every list *user* owns or collaborates on."""
+    owned = List.objects.filter(owner=user).order_by().values_list(
+        "pk", Value(OWNER, output_field=CharField())
+    )
+    joined = Collaborator.objects.filter(user=user).order_by().values_list(
+        "list_id", Value(COLLABORATOR, output_field=CharField())
+    )
+    return owned.union(joined, all=True)
+
+
+def member_list_version(user, list_id) -> int | None:
+    """Return the version of list *list_id*, or ``None`` if *user* may not see it.
+
+    Always asks the database, bypassing the cached access map.
+    """
+    return (
+        List.objects.filter(pk=list_id)
+        .filter(
+            Q(owner=user)
+            | Exists(Collaborator.objects.filter(list=OuterRef("pk"), user_id=user.pk))
+        )
+        .values_list("version", flat=True)
+        .first()
+    )
+
+
+def accessible_lists(user) -> dict[int, str]:
+    """Return ``{list_id: role}`` for every list *user* owns or collaborates on."""
+    key = _access_key(user.pk)
+    roles = cache.get(key)
+    if roles is None:
+        roles = dict(membership_roles(user))
+        cache.set(key, roles, settings.LIST_ACCESS_CACHE_TTL)
+    return roles
+
+
+def get_list_for_user(request, pk):
+    """Return ``(list, role)`` for the list *pk* as seen by the requesting user.
+
+    *role* is ``OWNER``, ``COLLABORATOR`` or ``None`` for users without
+    access; raises ``Http404`` when the list does not exist.  For safe
+    (read-only) requests authorization comes from the cached access map when
+    available, so the list itself is the only query; otherwise, and always
+    for writes, the role is resolved in the same query and the map is
+    rebuilt for the next request.  Results are memoized on the request.
+    """
+    resolved = getattr(request, "_list_access", None)
+    if resolved is None:
+        resolved = request._list_access = {}
+    if pk in resolved:
+        return resolved[pk]
+
+    user = request.user
+    roles = None
+    if request.method in SAFE_METHODS:
+        # A removed collaborator may still be in another worker's cached map.
+        roles = cache.get(_access_key(user.pk))
+    lists = List.objects.select_related("owner")
+    if roles is not None:
+        lst = get_object_or_404(lists, pk=pk)
+        role = roles.get(lst.pk)
+    else:
+        lst = get_object_or_404(
+            lists.annotate(
+                is_collaborator=Exists(
+                    Collaborator.objects.filter(list=OuterRef("pk"), user_id=user.pk)
+                )
+            ),
+            pk=pk,
+        )
+        if lst.owner_id == user.pk:
+            role = OWNER
+        elif lst.is_collaborator:
+            role = COLLABORATOR
+        else:
+            role = None
+        # Warm the map so the user's next requests skip the role lookup.
+        accessible_lists(user)
+
+    resolved[pk] = (lst, role)
+    return lst, role
@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from .models import Collaborator, List, ListItem, TranslationCache
+from .ranking import append_rank, rank_after
 
 
 class CollaboratorInline(admin.TabularInline):
@@ -19,11 +20,25 @@ class ListAdmin(admin.ModelAdmin):
     readonly_fields = ("share_token",)
     inlines = [CollaboratorInline, ListItemInline]
 
+    def save_formset(self, request, form, formset, change):
+        if formset.model is ListItem:
+            rank = None
+            for item_form in formset.forms:
+                if item_form.has_changed() and not item_form.instance.rank:
+                    rank = rank_after(rank) if rank else append_rank(form.instance.pk)
+                    item_form.instance.rank = rank
+        super().save_formset(request, form, formset, change)
+
 
 @admin.register(ListItem)
 class ListItemAdmin(admin.ModelAdmin):
     list_display = ("text", "list", "source_language", "added_by", "is_checked")
 
+    def save_model(self, request, obj, form, change):
+        if not obj.rank:
+            obj.rank = append_rank(obj.list_id)
+        super().save_model(request, obj, form, change)
+
 
 @admin.register(TranslationCache)
 class TranslationCacheAdmin(admin.ModelAdmin):
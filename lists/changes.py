@@ -0,0 +1,86 @@
+"""Per-list change log, so pages can catch up without re-rendering everything.
+
+Every mutation of a list goes through ``record_change`` (or
+``record_changes`` for several lists at once), which increments
+``List.version`` and appends one ``ListChange`` per affected item under the
+new version, in one transaction.  The log therefore has no gaps: a client
+that rendered version *N* needs exactly the entries after *N*.
+``compact_changes`` deletes old entries; a client whose version is older
+than the oldest remaining entry has to resync.  New versions are announced
+to open list pages through ``lists.events`` once the transaction commits.
+"""
+
+from functools import partial
+
+from django.db import transaction
+
+from .events import publish_versions
+from .models import List, ListChange, bump_list_versions
+
+
+def record_changes(op: str, item_ids_by_list: dict, touch: bool = False) -> dict[int, int]:
+    """Log *op* for the items of each list in *item_ids_by_list*.
+
+    *item_ids_by_list* maps list pks to item pks (empty for changes to the
+    list itself).  Returns the new version of each list.
+    """
+    if not item_ids_by_list:
+        return {}
+    with transaction.atomic():
+        # The UPDATE locks the list rows, so versions are read back unchanged
+        # and entries are committed in version order.
+        bump_list_versions(*item_ids_by_list, touch=touch)
+        versions = dict(
+            List.objects.filter(pk__in=list(item_ids_by_list)).values_list("pk", "version")
+        )
+        ListChange.objects.bulk_create(
+            ListChange(list_id=list_id, version=versions[list_id], op=op, item_id=item_id)
+            for list_id, item_ids in item_ids_by_list.items()
+            if list_id in versions
+            for item_id in (item_ids or [None])
+        )
+        transaction.on_commit(partial(publish_versions, versions))
+    return versions
+
+
+def record_change(list_id: int, op: str, *item_ids: int, touch: bool = False) -> int | None:
+    """Log *op* for *item_ids* of one list; returns its new version."""
+    return record_changes(op, {list_id: item_ids}, touch=touch).get(list_id)
+
+
+def changes_after(list_id: int, since: int):
+    """Return the log entries of a list after version *since*, oldest first."""
+    return ListChange.objects.filter(list_id=list_id, version__gt=since).values_list(
+        "version", "item_id"
+    )
+
+
+def changed_items(lst, since: int) -> list[int] | None:
+    """Return the pks of items changed after version *since*, oldest change first.
+
+    Returns ``None`` when the entries following *since* are no longer
+    available (compacted) or *since* is not a version of this list, in which
+    case the client has to reload the list.
+    """
+    if since == lst.version:
+        return []
+    if not 0 <= since < lst.version:
+        return None
+    entries = list(changes_after(lst.pk, since))
+    if not entries or entries[0][0] != since + 1:
+        return None
+    return list(dict.fromkeys(item_id for _, item_id in entries if item_id is not None))
+
+
+def compact_changes(before, chunk_size: int = 1000) -> int:
+    """Delete log entries created before *before*, *chunk_size* rows at a time."""
+    deleted = 0
+    while True:
+        pks = list(
+            ListChange.objects.filter(created_at__lt=before)
+            .order_by("created_at")
+            .values_list("pk", flat=True)[:chunk_size]
+        )
+        if not pks:
+            return deleted
+        deleted += ListChange.objects.filter(pk__in=pks).delete()[0]
@@ -0,0 +1,278 @@
+"""Push notifications of committed list changes to open list pages (SSE).
+
+``lists.changes.record_changes`` publishes ``(list_id, version)`` once its
+transaction commits.  A subscription (one per connected page) does not queue
+events: it only remembers the newest version announced for its list and wakes
+its waiting thread, which then reads what changed from the change log.  Memory
+per connection is therefore constant however many changes arrive.
+
+Events reach other processes (gunicorn workers, the translation worker)
+through the backend selected by ``LIST_EVENTS_BACKEND``:
+
+* ``local``: this process only (development server);
+* ``postgres``: ``NOTIFY`` on publish and one ``LISTEN`` connection per process;
+* ``polling``: one thread per process reads new ``ListChange`` rows every
+  ``LIST_EVENTS_POLL_INTERVAL`` seconds (SQLite, or any database);
+* ``off``: no push, list pages poll ``list_changes`` instead.
+
+``auto`` (the default) picks ``postgres`` or ``polling`` by database vendor.
+
+Every open stream holds a server thread, so each process serves at most
+``LIST_EVENTS_MAX_STREAMS`` of them at a time (see ``stream_slots``); pages
+that do not get a slot poll ``list_changes`` instead.
+"""
+
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError, close_old_connections, connection, connections
+from django.db.models import Max
+
+from .models import ListChange
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """Wakes one waiting stream when its list changes."""
+
+    __slots__ = ("list_id", "version", "_event", "_bus")
+
+    def __init__(self, bus, list_id: int):
+        self.list_id = list_id
+        self.version = 0
+        self._event = threading.Event()
+        self._bus = bus
+
+    def notify(self, version: int) -> None:
+        if version > self.version:
+            self.version = version
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the list changed or *timeout* passed; return whether it changed."""
+        changed = self._event.wait(timeout)
+        self._event.clear()
+        return changed
+
+    def close(self) -> None:
+        self._bus.unsubscribe(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LocalBus:
+    """Fan list change notifications out to this process's subscriptions."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = {}
+
+    def subscribe(self, list_id: int) -> Subscription:
+        subscription = Subscription(self, list_id)
+        with self._lock:
+            self._subscriptions.setdefault(list_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.list_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.list_id]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def publish(self, list_id: int, version: int) -> None:
+        """Announce that *list_id* reached *version* (called after commit)."""
+        self.deliver(list_id, version)
+
+    def deliver(self, list_id: int, version: int) -> None:
+        with self._lock:
+            subscriptions = tuple(self._subscriptions.get(list_id, ()))
+        for subscription in subscriptions:
+            subscription.notify(version)
+
+    def deliver_all(self) -> None:
+        """Wake every subscription, e.g. after notifications may have been missed."""
+        with self._lock:
+            subscriptions = [s for group in self._subscriptions.values() for s in group]
+        for subscription in subscriptions:
+            subscription.notify(subscription.version)
+
+
+class _BackgroundBus(LocalBus):
+    """A local bus whose cross-process delivery runs in a daemon thread.
+
+    The thread is started with the first subscription, so processes that
+    only publish (such as the translation worker) never start it.
+    """
+
+    thread_name = "list-events"
+
+    def __init__(self):
+        super().__init__()
+        self._thread = None
+
+    def subscribe(self, list_id: int) -> Subscription:
+        subscription = super().subscribe(list_id)
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name=self.thread_name, daemon=True
+                    )
+                    self._thread.start()
+        return subscription
+
+    def _run(self):
+        raise NotImplementedError
+
+
+class PollingBus(_BackgroundBus):
+    """Delivers other processes' changes by polling the ``ListChange`` table.
+
+    One query per interval per process, whatever the number of subscribers,
+    and none while nobody is subscribed.
+    """
+
+    thread_name = "list-events-poll"
+
+    def __init__(self, interval: float):
+        super().__init__()
+        self.interval = interval
+        self._last_pk = None
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                if self.subscriber_count():
+                    self.poll()
+                else:
+                    self._last_pk = None
+            except DatabaseError:
+                logger.exception("Polling for list changes failed.")
+            finally:
+                close_old_connections()
+
+    def poll(self) -> None:
+        """Deliver the newest version of every list changed since the last poll."""
+        if self._last_pk is None:
+            self._last_pk = ListChange.objects.aggregate(last=Max("pk"))["last"] or 0
+            # Changes between subscribing and this first poll are read by the
+            # streams themselves when they start.
+            return
+        changed = (
+            ListChange.objects.filter(pk__gt=self._last_pk)
+            .order_by()
+            .values("list_id")
+            .annotate(version=Max("version"), last_pk=Max("pk"))
+        )
+        for row in changed:
+            self._last_pk = max(self._last_pk, row["last_pk"])
+            self.deliver(row["list_id"], row["version"])
+
+
+class PostgresBus(_BackgroundBus):
+    """Delivers changes across processes with PostgreSQL ``LISTEN``/``NOTIFY``."""
+
+    channel = "lists_changed"
+    thread_name = "list-events-listen"
+
+    def __init__(self, retry_interval: float):
+        super().__init__()
+        self.retry_interval = retry_interval
+
+    def publish(self, list_id: int, version: int) -> None:
+        # Delivered to this process too, through its own LISTEN connection.
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, f"{list_id}:{version}"])
+
+    def _run(self):
+        import psycopg
+
+        params = connections["default"].get_connection_params()
+        while True:
+            try:
+                with psycopg.connect(**params, autocommit=True) as listener:
+                    listener.execute(f"LISTEN {self.channel}")
+                    # Anything sent while (re)connecting was missed.
+                    self.deliver_all()
+                    for notify in listener.notifies():
+                        list_id, _, version = notify.payload.partition(":")
+                        self.deliver(int(list_id), int(version))
+            except psycopg.Error:
+                logger.exception("Listening for list changes failed; reconnecting.")
+                time.sleep(self.retry_interval)
+
+
+_bus = None
+_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> LocalBus | None:
+    """Return this process's list event bus, or ``None`` when push is off."""
+    global _bus
+    backend = settings.LIST_EVENTS_BACKEND
+    if backend == "off":
+        return None
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                _bus = _create_bus(backend)
+    return _bus
+
+
+def _create_bus(backend: str) -> LocalBus:
+    if backend == "auto":
+        backend = "postgres" if connection.vendor == "postgresql" else "polling"
+    if backend == "local":
+        return LocalBus()
+    if backend == "polling":
+        return PollingBus(settings.LIST_EVENTS_POLL_INTERVAL)
+    if backend == "postgres":
+        if connection.vendor != "postgresql":
+            raise ImproperlyConfigured("LIST_EVENTS_BACKEND 'postgres' requires PostgreSQL.")
+        return PostgresBus(settings.LIST_EVENTS_POLL_INTERVAL)
+    raise ImproperlyConfigured(f"Unknown LIST_EVENTS_BACKEND {backend!r}.")
+
+
+_stream_slots = None
+
+
+def stream_slots() -> threading.BoundedSemaphore:
+    """Return the semaphore bounding this process's concurrently open streams.
+
+    Shared by list event and translation streams, so long-lived connections
+    cannot take every thread and leave none for ordinary requests.
+    """
+    global _stream_slots
+    if _stream_slots is None:
+        with _bus_lock:
+            if _stream_slots is None:
+                _stream_slots = threading.BoundedSemaphore(settings.LIST_EVENTS_MAX_STREAMS)
+    return _stream_slots
+
+
+def publish_versions(versions: dict[int, int]) -> None:
+    """Announce the new version of each changed list (see ``record_changes``)."""
+    bus = get_event_bus()
+    if bus is None:
+        return
+    for list_id, version in versions.items():
+        try:
+            bus.publish(list_id, version)
+        except DatabaseError:
+            # Pages still catch up on their next change or reconnect.
+            logger.exception("Could not publish a change of list %s.", list_id)
@@ -0,0 +1,74 @@
+"""Cache of rendered ``partials/item_row.html`` fragments.
+
+Rendering a row reverses three URLs and runs several ``{% trans %}`` lookups,
+which dominates the rendering of long lists.  Rendered rows are kept in a
+per-process ``LRUCache`` under ``(item id, target language, UI language)``,
+stored together with a digest of everything the row shows (text, languages,
+checked state, translated text and state).  A row changed by any view, the
+translation worker or another process therefore no longer matches its entry
+and is re-rendered and replaced on its next use, with no invalidation
+messages needed; deleted items simply age out.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from translations.cache import LRUCache
+
+ROW_TEMPLATE = "partials/item_row.html"
+DIGEST_LENGTH = 16
+
+
+def row_digest(entry, lst) -> str:
+    """Return a digest of the state *entry* (an ``ItemRow``) is rendered from."""
+    item = entry.item
+    state = (
+        lst.pk,
+        item.text,
+        item.source_language,
+        item.is_checked,
+        entry.display_text,
+        entry.is_translated,
+        entry.translation_pending,
+    )
+    return hashlib.blake2b(repr(state).encode(), digest_size=DIGEST_LENGTH // 2).hexdigest()
+
+
+class RowFragmentCache:
+    """Renders item rows, reusing the HTML of rows whose state is unchanged."""
+
+    def __init__(self):
+        self.local = LRUCache(
+            max_entries=settings.ITEM_ROW_CACHE_MAX_ENTRIES,
+            max_bytes=settings.ITEM_ROW_CACHE_MAX_BYTES,
+            ttl=settings.ITEM_ROW_CACHE_TTL,
+        )
+
+    def render(self, rows, lst, target_language: str) -> str:
+        """Return the concatenated HTML of *rows* as shown on *lst*'s page."""
+        template = get_template(ROW_TEMPLATE, using=settings.PARTIALS_TEMPLATE_ENGINE)
+        ui_language = get_language()
+        html = []
+        for entry in rows:
+            key = (entry.item.pk, target_language, ui_language)
+            digest = row_digest(entry, lst)
+            cached = self.local.get(key) if self.local.max_entries else None
+            if cached is not None and cached[:DIGEST_LENGTH] == digest:
+                html.append(cached[DIGEST_LENGTH:])
+                continue
+            row = template.render({"entry": entry, "list": lst})
+            if self.local.max_entries:
+                # Stored with its digest in front, replacing any stale version.
+                self.local.set(key, digest + row)
+            html.append(row)
+        return mark_safe("".join(html))
+
+    def stats(self) -> dict:
+        return self.local.stats()
+
+
+row_fragments = RowFragmentCache()
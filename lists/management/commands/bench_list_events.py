@@ -0,0 +1,114 @@
+"""Management command to check that list event subscriptions stay small under load."""
+
+import random
+import threading
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+
+from lists.events import LocalBus
+
+
+class Command(BaseCommand):
+    help = (
+        "Connect many list event subscribers at once, publish a burst of changes "
+        "and report the memory used per subscriber. Fails if memory grows with "
+        "the number of events instead of staying bounded per connection."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--subscribers",
+            type=int,
+            default=1000,
+            help="Concurrently waiting subscribers, one thread each (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--lists",
+            type=int,
+            default=50,
+            help="Lists the subscribers are spread over (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--events",
+            type=int,
+            default=20000,
+            help="Changes published during the run (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--max-growth",
+            type=int,
+            default=64,
+            help="Allowed memory growth per subscriber while publishing, in bytes (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        subscribers = options["subscribers"]
+        if subscribers < 1 or options["lists"] < 1:
+            raise CommandError("--subscribers and --lists must be at least 1.")
+
+        bus = LocalBus()
+        stop = threading.Event()
+        wakeups = [0] * subscribers
+
+        def listen(index, subscription):
+            while not stop.is_set():
+                if subscription.wait(1.0):
+                    wakeups[index] += 1
+
+        tracemalloc.start()
+        before_subscribe = tracemalloc.get_traced_memory()[0]
+        subscriptions = [
+            bus.subscribe(index % options["lists"] + 1) for index in range(subscribers)
+        ]
+        per_subscription = (tracemalloc.get_traced_memory()[0] - before_subscribe) / subscribers
+
+        threads = [
+            threading.Thread(target=listen, args=(index, subscription), daemon=True)
+            for index, subscription in enumerate(subscriptions)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+
+        # Publish in two equal halves: the first warms up (counters, versions),
+        # the second must not need any more memory if nothing is queued.
+        half = options["events"] // 2
+        started = time.perf_counter()
+        for version in range(1, half + 1):
+            bus.publish(random.randint(1, options["lists"]), version)
+        time.sleep(0.2)
+        warm = tracemalloc.get_traced_memory()[0]
+        for version in range(half + 1, 2 * half + 1):
+            bus.publish(random.randint(1, options["lists"]), version)
+        elapsed = time.perf_counter() - started - 0.2
+        time.sleep(0.2)
+        growth = tracemalloc.get_traced_memory()[0] - warm
+
+        stop.set()
+        bus.deliver_all()
+        for thread in threads:
+            thread.join()
+        tracemalloc.stop()
+        for subscription in subscriptions:
+            subscription.close()
+
+        self.stdout.write(f"Subscribers:           {subscribers} on {options['lists']} list(s)")
+        self.stdout.write(f"Memory per subscriber: {per_subscription:.0f} bytes")
+        self.stdout.write(
+            f"Published:             {2 * half} events in {elapsed:.2f}s "
+            f"({2 * half / elapsed:.0f}/s)"
+        )
+        self.stdout.write(
+            f"Wake-ups:              {sum(wakeups)} (coalesced from "
+            f"{2 * half * subscribers // options['lists']} deliveries)"
+        )
+        self.stdout.write(
+            f"Growth (second half):  {growth} bytes ({growth / subscribers:.1f} per subscriber)"
+        )
+        if bus.subscriber_count():
+            raise CommandError("Subscriptions were not released.")
+        if growth / subscribers > options["max_growth"]:
+            raise CommandError("Memory grew with the number of events.")
+        self.stdout.write(self.style.SUCCESS("Done. Memory per subscriber stays bounded."))
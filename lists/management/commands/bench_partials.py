@@ -0,0 +1,124 @@
+"""Management command to compare the Django and Jinja2 renderings of the hot partials."""
+
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import get_template
+from django.test import RequestFactory, override_settings
+from django.utils import translation
+
+from lists.fragments import row_fragments
+from lists.models import Collaborator, List, ListItem
+from translations.cache import LRUCache
+from translations.services import ItemRow
+
+ENGINES = ("django", "jinja2")
+
+
+def sample_context(rows: int) -> dict:
+    """Return a list-page context with *rows* unsaved items in every display state."""
+    lst = List(pk=1, title="Groceries")
+    User = get_user_model()
+    items = []
+    for n in range(1, rows + 1):
+        item = ListItem(
+            pk=n,
+            list=lst,
+            text=f"Item <{n}> & co",
+            source_language="fr",
+            is_checked=n % 4 == 0,
+        )
+        if n % 3 == 0:
+            items.append(ItemRow(item, item.text, translation_pending=True))
+        elif n % 3 == 1:
+            items.append(ItemRow.translated(item, f"Translated {n}"))
+        else:
+            items.append(ItemRow(item, item.text))
+    collaborators = [
+        Collaborator(pk=n, list=lst, user=User(pk=n, username=f"user{n}", email=f"o'{n}@example.com"))
+        for n in range(1, min(rows, 50) + 1)
+    ]
+    return {
+        "items": items,
+        "list": lst,
+        "has_pending": True,
+        "window_after": "",
+        "next_cursor": "abc",
+        "collaborators": collaborators,
+        "is_owner": True,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the item list and collaborator list partials with both template "
+        "engines over lists of several sizes, report the time per render and "
+        "fail if the HTML differs."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[10, 100, 1000],
+            help="List sizes to render (default: 10 100 1000)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Renders per engine and size; the fastest is reported (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--language",
+            default=settings.LANGUAGE_CODE,
+            help="UI language to render in (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        request = RequestFactory().get("/")
+        request.user = get_user_model()(pk=1, preferred_language="en")
+
+        # Rows must be rendered on every pass, not served from the fragment cache.
+        fragment_cache = row_fragments.local
+        row_fragments.local = LRUCache(max_entries=0, max_bytes=0, ttl=0)
+        mismatches = []
+        try:
+            with translation.override(options["language"]):
+                self.stdout.write(f"{'rows':>6} {'partial':<24} {'django':>10} {'jinja2':>10} {'speedup':>8}")
+                for rows in options["rows"]:
+                    context = sample_context(rows)
+                    for name in ("partials/item_list.html", "partials/collaborator_list.html"):
+                        timings, outputs = {}, {}
+                        for engine in ENGINES:
+                            timings[engine], outputs[engine] = self._render(
+                                engine, name, context, request, options["repeat"]
+                            )
+                        if outputs["django"] != outputs["jinja2"]:
+                            mismatches.append(f"{name} ({rows} rows)")
+                        self.stdout.write(
+                            f"{rows:>6} {name.split('/')[-1]:<24} "
+                            f"{timings['django'] * 1000:>8.2f}ms {timings['jinja2'] * 1000:>8.2f}ms "
+                            f"{timings['django'] / timings['jinja2']:>7.1f}x"
+                        )
+        finally:
+            row_fragments.local = fragment_cache
+
+        if mismatches:
+            raise CommandError(f"Rendered HTML differs between engines: {', '.join(mismatches)}")
+        self.stdout.write(self.style.SUCCESS("Done. Both engines render identical HTML."))
+
+    @staticmethod
+    def _render(engine, name, context, request, repeat):
+        """Return the fastest of *repeat* render times and the rendered HTML."""
+        template = get_template(name, using=engine)
+        best = float("inf")
+        with override_settings(PARTIALS_TEMPLATE_ENGINE=engine):
+            for _ in range(repeat):
+                started = time.perf_counter()
+                html = template.render(context, request)
+                best = min(best, time.perf_counter() - started)
+        return best, html
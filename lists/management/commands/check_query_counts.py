@@ -0,0 +1,138 @@
+"""Management command to verify that request query counts do not grow with list size."""
+
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from lists.models import Collaborator, List, ListChange, ListItem, TranslationCache
+
+
+class Command(BaseCommand):
+    help = (
+        "Request the list overview, a list page, an item toggle and the list's "
+        "deletion for lists of two sizes and fail if any of them runs a different "
+        "number of queries. "
+        "Test data is created in a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs=2,
+            default=[5, 100],
+            metavar=("SMALL", "LARGE"),
+            help="Item counts of the two lists compared (default: 5 100)",
+        )
+
+    def handle(self, *args, **options):
+        small, large = options["sizes"]
+        if not 1 <= small < large:
+            raise CommandError("--sizes must be two increasing item counts of at least 1.")
+
+        # Warm process-wide caches (e.g. the language pair index) first, so
+        # both sizes are measured in the same state.
+        self._count_queries(small)
+        counts = {size: self._count_queries(size) for size in (small, large)}
+
+        self.stdout.write(f"{'request':<14} {small:>7} {large:>7}")
+        failures = []
+        for name in counts[small]:
+            marker = ""
+            if counts[small][name] != counts[large][name]:
+                failures.append(name)
+                marker = self.style.ERROR("  differs")
+            self.stdout.write(
+                f"{name:<14} {counts[small][name]:>7} {counts[large][name]:>7}{marker}"
+            )
+
+        if failures:
+            raise CommandError(
+                f"Query count depends on the number of items: {', '.join(failures)}."
+            )
+        self.stdout.write(self.style.SUCCESS("Done. Query counts do not depend on list size."))
+
+    def _count_queries(self, size: int) -> dict[str, int]:
+        """Return the queries run by each request against a list of *size* items."""
+        counts = {}
+        with transaction.atomic(), override_settings(ALLOWED_HOSTS=["testserver"]):
+            owner, collaborator = self._create_members()
+            lst = List.objects.create(title="Query count check", owner=owner)
+            Collaborator.objects.create(list=lst, user=collaborator)
+            items = ListItem.objects.bulk_create(
+                ListItem(
+                    list=lst,
+                    text=f"Item {n}",
+                    source_language="fr" if n % 2 else "en",
+                    added_by=collaborator if n % 2 else owner,
+                    rank=f"{n:06d}",
+                )
+                for n in range(size)
+            )
+            # Half of the foreign items already have a cached translation.
+            TranslationCache.objects.bulk_create(
+                TranslationCache(
+                    item=item,
+                    source_language="fr",
+                    target_language="en",
+                    translated_text=f"{item.text} (en)",
+                )
+                for item in items[1::4]
+            )
+
+            client = Client()
+            client.force_login(owner)
+            requests = [
+                ("list_index", 200, lambda: client.get(reverse("lists:list_index"))),
+                (
+                    "list_detail",
+                    200,
+                    lambda: client.get(reverse("lists:list_detail", args=[lst.pk])),
+                ),
+                (
+                    "item_toggle",
+                    200,
+                    lambda: client.post(
+                        reverse("lists:item_toggle", args=[lst.pk, items[0].pk]),
+                        {"last_item_id": items[-1].pk},
+                        HTTP_HX_REQUEST="true",
+                    ),
+                ),
+                # Last: deletes the list, collaborators included.
+                (
+                    "list_delete",
+                    302,
+                    lambda: client.post(reverse("lists:list_delete", args=[lst.pk])),
+                ),
+            ]
+            for name, expected_status, request in requests:
+                with CaptureQueriesContext(connection) as queries:
+                    response = request()
+                if response.status_code != expected_status:
+                    raise CommandError(f"{name} returned {response.status_code} for {size} items.")
+                counts[name] = len(queries)
+
+            # Foreign keys are only checked on commit, which never happens
+            # here, so look for change rows left pointing at the deleted list.
+            if ListChange.objects.filter(list_id=lst.pk).exists():
+                raise CommandError("Deleting a shared list left change log rows behind.")
+
+            transaction.set_rollback(True)
+        return counts
+
+    @staticmethod
+    def _create_members():
+        User = get_user_model()
+        suffix = uuid.uuid4().hex[:12]
+        owner = User.objects.create_user(
+            f"querycount-owner-{suffix}", preferred_language="en"
+        )
+        collaborator = User.objects.create_user(
+            f"querycount-collaborator-{suffix}", preferred_language="fr"
+        )
+        return owner, collaborator
@@ -0,0 +1,130 @@
+"""Management command to verify that hot queries are served by indexes."""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from lists.access import membership_roles
+from lists.changes import changes_after
+from lists.models import List
+from lists.pagination import encode_cursor, keyset_queryset
+from lists.ranking import items_from_last
+from lists.views import (
+    ITEM_WINDOW_KEYS,
+    LIST_ARCHIVED_KEYS,
+    LIST_INDEX_KEYS,
+    archived_lists,
+    index_lists,
+    window_items,
+)
+from translations.queue import due_jobs, stale_jobs
+
+
+def hot_queries():
+    """Return ``(name, queryset, sorts)`` for the queries on the request path.
+
+    The querysets are built by the same functions the views and the worker
+    use; parameter values are placeholders, the plans do not depend on them.
+    *sorts* is true for the one query that has to sort: the list overview
+    orders a user's own and shared lists by that user's pins, which no index
+    can provide, so it sorts the user's memberships (and nothing else).
+    """
+    user = get_user_model()(pk=1, preferred_language="fr")
+    lst = List(pk=1)
+    now = timezone.now()
+    per_page = 30
+
+    def page(queryset, keys, cursor, descending=True):
+        return keyset_queryset(queryset, keys, cursor, per_page, descending)
+
+    return [
+        ("list overview", page(index_lists(user), LIST_INDEX_KEYS, None), True),
+        (
+            "list overview, next page",
+            page(index_lists(user), LIST_INDEX_KEYS, encode_cursor([False, now, 1])),
+            True,
+        ),
+        ("archived lists", page(archived_lists(user), LIST_ARCHIVED_KEYS, None), False),
+        (
+            "archived lists, next page",
+            page(archived_lists(user), LIST_ARCHIVED_KEYS, encode_cursor([now, 1])),
+            False,
+        ),
+        (
+            "item window",
+            page(window_items(lst, user), ITEM_WINDOW_KEYS, None, descending=False),
+            False,
+        ),
+        (
+            "item window, next page",
+            page(
+                window_items(lst, user),
+                ITEM_WINDOW_KEYS,
+                encode_cursor(["a", now, 1]),
+                descending=False,
+            ),
+            False,
+        ),
+        ("last item of a list", items_from_last(lst.pk)[:1], False),
+        ("changes of a list after a version", changes_after(lst.pk, 1), False),
+        ("lists a user can open", membership_roles(user), False),
+        ("due translation jobs", due_jobs(now)[:50], False),
+        ("stale translation jobs", stale_jobs(now - timedelta(minutes=5))[:50], False),
+    ]
+
+
+def unindexed_steps(plan: str, sorts: bool = False) -> list[str]:
+    """Return the lines of *plan* that scan a table or sort without an index.
+
+    With *sorts*, sorting the final result is accepted.
+    """
+    if connection.vendor == "postgresql":
+        return [
+            line
+            for line in plan.splitlines()
+            if "Seq Scan on " in line
+            or (not sorts and line.lstrip(" ->").startswith(("Sort ", "Incremental Sort ")))
+        ]
+    return [
+        line
+        for line in plan.splitlines()
+        if ("SCAN " in line and "INDEX" not in line and "CONSTANT ROW" not in line)
+        or ("TEMP B-TREE" in line and not (sorts and "ORDER BY" in line))
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Run EXPLAIN on the application's hot queries and fail if any of them "
+        "scans its table or sorts instead of using an index (SQLite and PostgreSQL)."
+    )
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("sqlite", "postgresql"):
+            raise CommandError(f"Query plans cannot be checked on {connection.vendor}.")
+
+        failures = []
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                # Small development tables make sequential scans look cheapest;
+                # what matters here is whether an index *can* be used.
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+
+            for name, queryset, sorts in hot_queries():
+                plan = queryset.explain()
+                steps = unindexed_steps(plan, sorts)
+                if options["verbosity"] >= 2:
+                    self.stdout.write(f"{name}:\n{plan}\n")
+                if steps:
+                    failures.append(name)
+                    self.stdout.write(self.style.ERROR(f"NO INDEX   {name}: {steps[0].strip()}"))
+                else:
+                    self.stdout.write(f"index      {name}")
+
+        if failures:
+            raise CommandError(f"{len(failures)} hot query(ies) scan or sort without an index.")
+        self.stdout.write(self.style.SUCCESS("Done. Every hot query uses an index."))
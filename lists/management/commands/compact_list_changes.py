@@ -0,0 +1,50 @@
+"""Management command to delete old list change log entries."""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from lists.changes import compact_changes
+from lists.models import ListChange
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete list change log entries older than LIST_CHANGE_RETENTION. Pages "
+        "that last synced before then reload their items instead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=None,
+            help="Keep entries this many seconds old (default: LIST_CHANGE_RETENTION)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Rows deleted per statement (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report how many entries would be deleted without deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        max_age = options["max_age"]
+        if max_age is None:
+            max_age = settings.LIST_CHANGE_RETENTION
+        before = timezone.now() - timedelta(seconds=max_age)
+
+        if options["dry_run"]:
+            count = ListChange.objects.filter(created_at__lt=before).count()
+            self.stdout.write(self.style.SUCCESS(f"Done. {count} entry(ies) would be deleted."))
+            return
+
+        count = compact_changes(before, options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Done. {count} entry(ies) deleted."))
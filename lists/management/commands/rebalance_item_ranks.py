@@ -0,0 +1,67 @@
+"""Management command to rewrite overgrown or duplicated item rank keys."""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import Length
+
+from lists.models import ListItem
+from lists.ranking import resequence
+
+
+class Command(BaseCommand):
+    help = (
+        "Resequence lists whose item rank keys have grown long through repeated "
+        "moves or collide after concurrent appends."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-length",
+            type=int,
+            default=None,
+            help="Resequence lists with keys longer than this (default: half of LIST_RANK_MAX_LENGTH)",
+        )
+        parser.add_argument(
+            "--list",
+            type=int,
+            action="append",
+            dest="lists",
+            help="Resequence only this list (may be repeated); always rewrites it.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the lists that would be resequenced without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        if options["lists"]:
+            list_ids = sorted(set(options["lists"]))
+        else:
+            max_length = options["max_length"] or settings.LIST_RANK_MAX_LENGTH // 2
+            long_keys = (
+                ListItem.objects.annotate(key_length=Length("rank"))
+                .filter(key_length__gt=max_length)
+                .values_list("list_id", flat=True)
+            )
+            duplicates = (
+                ListItem.objects.values("list_id", "rank")
+                .annotate(count=Count("pk"))
+                .filter(count__gt=1)
+                .values_list("list_id", flat=True)
+            )
+            list_ids = sorted({*long_keys, *duplicates})
+
+        if options["dry_run"]:
+            self.stdout.write(f"Dry run: {len(list_ids)} list(s) would be resequenced.")
+            return
+
+        for list_id in list_ids:
+            with transaction.atomic():
+                resequence(list_id)
+            if options["verbosity"] >= 2:
+                self.stdout.write(f"Resequenced list {list_id}.")
+
+        self.stdout.write(self.style.SUCCESS(f"Done. Resequenced {len(list_ids)} list(s)."))
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:09
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lists", "0007_alter_listitem_source_language"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="translationcache",
+            name="last_accessed_at",
+            field=models.DateTimeField(
+                db_index=True, default=django.utils.timezone.now
+            ),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def _rank_sequence(count):
+    """Evenly spaced base-36 keys, as in lists.ranking.rank_sequence."""
+    width = 1
+    while 36 ** width < (count + 1) * 2:
+        width += 1
+    step = 36 ** width // (count + 1)
+    keys = []
+    for n in range(1, count + 1):
+        value = step * n
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, 36)
+            digits.append(DIGITS[digit])
+        keys.append("".join(reversed(digits)).rstrip("0"))
+    return keys
+
+
+def order_to_rank(apps, schema_editor):
+    """Convert each list's integer positions into rank keys."""
+    ListItem = apps.get_model("lists", "ListItem")
+
+    by_list = {}
+    for item in ListItem.objects.order_by("list_id", "order", "created_at").only("pk", "list_id"):
+        by_list.setdefault(item.list_id, []).append(item)
+
+    changed = []
+    for items in by_list.values():
+        for item, key in zip(items, _rank_sequence(len(items))):
+            item.rank = key
+            changed.append(item)
+    ListItem.objects.bulk_update(changed, ["rank"], batch_size=500)
+
+
+def rank_to_order(apps, schema_editor):
+    ListItem = apps.get_model("lists", "ListItem")
+
+    by_list = {}
+    for item in ListItem.objects.order_by("list_id", "rank", "created_at").only("pk", "list_id"):
+        by_list.setdefault(item.list_id, []).append(item)
+
+    changed = []
+    for items in by_list.values():
+        for position, item in enumerate(items):
+            item.order = position
+            changed.append(item)
+    ListItem.objects.bulk_update(changed, ["order"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lists", "0008_translationcache_last_accessed_at"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="listitem",
+            name="rank",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.RunPython(order_to_rank, reverse_code=rank_to_order),
+        migrations.AlterModelOptions(
+            name="listitem",
+            options={"ordering": ["rank", "created_at", "pk"]},
+        ),
+        migrations.RemoveField(
+            model_name="listitem",
+            name="order",
+        ),
+    ]
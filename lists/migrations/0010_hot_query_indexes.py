@@ -0,0 +1,79 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+COVERING_INDEX = "translationcache_covering_idx"
+
+
+def add_covering_index(apps, schema_editor):
+    """Let PostgreSQL answer translation lookups from the index alone.
+
+    ``INCLUDE`` columns are PostgreSQL-only, so other backends rely on the
+    unique constraint's index.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {COVERING_INDEX} ON lists_translationcache "
+        "(item_id, source_language, target_language) INCLUDE (translated_text)"
+    )
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {COVERING_INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lists", "0009_listitem_rank"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="collaborator",
+            index=models.Index(
+                fields=["user", "list"], name="collaborator_user_list_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="list",
+            index=models.Index(
+                condition=models.Q(("is_archived", True)),
+                fields=["owner", "-updated_at", "-id"],
+                name="list_owner_archived_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="listitem",
+            index=models.Index(
+                fields=["list", "rank", "created_at"], name="listitem_list_rank_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="collaborator",
+            constraint=models.UniqueConstraint(
+                fields=("list", "user"), name="unique_list_collaborator"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="translationcache",
+            constraint=models.UniqueConstraint(
+                fields=("item", "source_language", "target_language"),
+                name="unique_item_translation",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="collaborator",
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name="translationcache",
+            unique_together=set(),
+        ),
+        migrations.RunPython(add_covering_index, reverse_code=drop_covering_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lists", "0010_hot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="list",
+            name="version",
+            field=models.PositiveBigIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lists", "0011_list_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ListChange",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.PositiveBigIntegerField()),
+                (
+                    "op",
+                    models.CharField(
+                        choices=[
+                            ("added", "Added"),
+                            ("checked", "Checked"),
+                            ("unchecked", "Unchecked"),
+                            ("deleted", "Deleted"),
+                            ("moved", "Moved"),
+                            ("translated", "Translated"),
+                            ("updated", "List updated"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("item_id", models.PositiveBigIntegerField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "list",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="changes",
+                        to="lists.list",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["version", "pk"],
+                "indexes": [
+                    models.Index(
+                        fields=["list", "version"], name="listchange_list_version_idx"
+                    )
+                ],
+            },
+        ),
+    ]
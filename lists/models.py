@@ -3,6 +3,7 @@ import string
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 def generate_share_token():
@@ -32,24 +33,63 @@ class List(models.Model):
         editable=False,
     )
     is_archived = models.BooleanField(default=False)
+    # Incremented by every change to what the list page shows; see
+    # bump_list_versions.  Used for ETags.
+    version = models.PositiveBigIntegerField(default=1, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ["-updated_at"]
+        indexes = [
+            # The archive page in display order (``updated_at``, then pk,
+            # both descending).  Partial, so SQLite can match Django's bare
+            # ``is_archived`` filter.  The overview mixes owned and shared
+            # lists and sorts by per-user pins, so no index can order it.
+            models.Index(
+                fields=["owner", "-updated_at", "-id"],
+                condition=models.Q(is_archived=True),
+                name="list_owner_archived_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # ``version`` only moves forward through bump_list_versions; writing
+        # back a stale in-memory value could hand out an old ETag again.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "version"
+            ]
+        super().save(*args, **kwargs)
+
     def get_share_url(self):
         return f"/lists/join/{self.share_token}/"
 
     def is_member(self, user):
-        if self.owner == user:
+        if self.owner_id == user.pk:
             return True
         return self.collaborators.filter(user=user).exists()
 
 
+def bump_list_versions(*list_ids, touch: bool = False) -> None:
+    """Atomically increment the version of every list in *list_ids*.
+
+    With *touch*, ``updated_at`` is refreshed as well, moving the lists to
+    the top of their members' overviews.
+    """
+    if not list_ids:
+        return
+    fields = {"version": models.F("version") + 1}
+    if touch:
+        fields["updated_at"] = timezone.now()
+    List.objects.filter(pk__in=list_ids).update(**fields)
+
+
 class Collaborator(models.Model):
     """A user who has been invited to collaborate on a list."""
 
@@ -66,12 +106,62 @@ class Collaborator(models.Model):
     joined_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ("list", "user")
+        constraints = [
+            models.UniqueConstraint(fields=["list", "user"], name="unique_list_collaborator"),
+        ]
+        indexes = [
+            # Membership lookups start from the user.
+            models.Index(fields=["user", "list"], name="collaborator_user_list_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user} on {self.list}"
 
 
+class ListChange(models.Model):
+    """One entry of a list's append-only change log (see ``lists.changes``).
+
+    All entries written by one mutation share the list version it produced;
+    ``item_id`` is a plain integer so entries outlive deleted items.
+    """
+
+    ADDED = "added"
+    CHECKED = "checked"
+    UNCHECKED = "unchecked"
+    DELETED = "deleted"
+    MOVED = "moved"
+    TRANSLATED = "translated"
+    UPDATED = "updated"
+    OP_CHOICES = [
+        (ADDED, "Added"),
+        (CHECKED, "Checked"),
+        (UNCHECKED, "Unchecked"),
+        (DELETED, "Deleted"),
+        (MOVED, "Moved"),
+        (TRANSLATED, "Translated"),
+        (UPDATED, "List updated"),
+    ]
+
+    list = models.ForeignKey(
+        List,
+        on_delete=models.CASCADE,
+        related_name="changes",
+    )
+    version = models.PositiveBigIntegerField()
+    op = models.CharField(max_length=10, choices=OP_CHOICES)
+    item_id = models.PositiveBigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ["version", "pk"]
+        indexes = [
+            models.Index(fields=["list", "version"], name="listchange_list_version_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.list_id} v{self.version}: {self.op} {self.item_id or ''}".rstrip()
+
+
 class ListItem(models.Model):
     """A single item on a list, stored in the language it was entered in."""
 
@@ -91,18 +181,27 @@ class ListItem(models.Model):
         related_name="list_items",
     )
     is_checked = models.BooleanField(default=False)
-    order = models.PositiveIntegerField(default=0)
+    # Sortable base-36 key, see lists.ranking.
+    rank = models.CharField(max_length=64, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        ordering = ["order", "created_at"]
+        ordering = ["rank", "created_at", "pk"]
+        indexes = [
+            models.Index(fields=["list", "rank", "created_at"], name="listitem_list_rank_idx"),
+        ]
 
     def __str__(self):
         return self.text
 
 
 class TranslationCache(models.Model):
-    """Caches translations of list items to avoid repeated API calls."""
+    """Caches translations of list items to avoid repeated API calls.
+
+    The table is bounded: ``last_accessed_at`` is refreshed in batches by
+    ``translations.retention`` and the ``compact_translation_cache`` command
+    evicts orphaned and cold rows beyond ``TRANSLATION_CACHE_MAX_ROWS``.
+    """
 
     item = models.ForeignKey(
         ListItem,
@@ -113,9 +212,17 @@ class TranslationCache(models.Model):
     target_language = models.CharField(max_length=10)
     translated_text = models.CharField(max_length=500)
     created_at = models.DateTimeField(auto_now_add=True)
+    last_accessed_at = models.DateTimeField(default=timezone.now, db_index=True)
 
     class Meta:
-        unique_together = ("item", "source_language", "target_language")
+        constraints = [
+            # On PostgreSQL migration 0010 also adds a covering index that
+            # includes translated_text, so lookups are index-only scans.
+            models.UniqueConstraint(
+                fields=["item", "source_language", "target_language"],
+                name="unique_item_translation",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.item.text} -> {self.translated_text} ({self.source_language}->{self.target_language})"
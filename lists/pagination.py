@@ -0,0 +1,129 @@
+"""Keyset ("seek") pagination for list overviews.
+
+Pages are addressed by an opaque cursor holding the sort key of the last row
+shown, so fetching page *n* costs the same as page 1 and rows created between
+requests do not shift later pages (as they would with offsets).
+"""
+
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+
+def _decode_exact(kind):
+    # Exact type checks: bool is a subclass of int but never a valid int key.
+    def decode(value):
+        if type(value) is not kind:
+            raise ValueError(f"Expected {kind.__name__}, got {value!r}")
+        return value
+
+    return decode
+
+
+def _decode_datetime(value):
+    if not isinstance(value, str):
+        raise ValueError(f"Expected an ISO datetime, got {value!r}")
+    return datetime.fromisoformat(value)
+
+
+_DECODERS = {
+    bool: _decode_exact(bool),
+    int: _decode_exact(int),
+    str: _decode_exact(str),
+    datetime: _decode_datetime,
+}
+
+
+class KeysetPage:
+    """One page of rows plus the cursor of the next page (``None`` on the last)."""
+
+    def __init__(self, items, next_cursor):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(values) -> str:
+    """Return an opaque, URL-safe cursor for a row's key *values*."""
+    raw = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys) -> list:
+    """Return the key values stored in *cursor*; raises ``ValueError`` if malformed.
+
+    Each value must have the JSON type of its key, so cursors such as
+    ``[null, null, null]`` are rejected instead of reaching the query.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor {cursor!r}") from exc
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError(f"Invalid cursor {cursor!r}")
+    try:
+        return [_DECODERS[kind](value) for (_, kind), value in zip(keys, values)]
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor {cursor!r}") from exc
+
+
+def _after(keys, values, descending: bool) -> Q:
+    """Return a filter for rows sorting strictly after *values*."""
+    condition = Q(pk__in=[])
+    for position, ((field, kind), value) in enumerate(zip(keys, values)):
+        equal = {key: v for (key, _), v in zip(keys[:position], values[:position])}
+        if kind is bool:
+            # Only one boolean value can follow the other.
+            if value != descending:
+                continue
+            step = Q(**equal, **{field: not value})
+        else:
+            lookup = "lt" if descending else "gt"
+            step = Q(**equal, **{f"{field}__{lookup}": value})
+        condition |= step
+    return condition
+
+
+def keyset_queryset(
+    queryset, keys, cursor: str | None, per_page: int, descending: bool = True
+):
+    """Return the query for the page of *queryset* following *cursor*.
+
+    Fetches one row more than *per_page*, which tells whether a next page
+    exists.  See ``keyset_paginate`` for *keys*.
+    """
+    prefix = "-" if descending else ""
+    queryset = queryset.order_by(*(f"{prefix}{field}" for field, _ in keys))
+    if cursor:
+        try:
+            queryset = queryset.filter(_after(keys, decode_cursor(cursor, keys), descending))
+        except ValueError:
+            pass
+    return queryset[:per_page + 1]
+
+
+def keyset_paginate(
+    queryset, keys, cursor: str | None, per_page: int, descending: bool = True
+) -> KeysetPage:
+    """Return the page of *queryset* following *cursor*, ordered by *keys*.
+
+    *keys* is a sequence of ``(field, type)`` pairs, e.g.
+    ``[("updated_at", datetime), ("pk", int)]``; the last one must be unique.
+    All keys are sorted in the same direction.  An invalid cursor starts from
+    the first page.
+    """
+    rows = list(keyset_queryset(queryset, keys, cursor, per_page, descending))
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, field) for field, _ in keys])
+    return KeysetPage(rows, next_cursor)
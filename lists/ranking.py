@@ -0,0 +1,206 @@
+"""Sortable rank keys for list items.
+
+Items are ordered by ``ListItem.rank``, a lowercase base-36 string read as
+the digits of a fraction between 0 and 1 (``"i"`` is 0.5, ``"9"`` just under
+0.25).  A key can always be generated between two others, so moving an item
+rewrites only that item, and appending only increments the current last key.
+Keys never end in ``"0"``, which keeps string order identical to numeric
+order.
+
+Repeated moves into the same gap make keys longer; ``resequence`` rewrites a
+whole list with short, evenly spaced keys in a single ``UPDATE`` and is run
+automatically when a key exceeds ``LIST_RANK_MAX_LENGTH`` (and in bulk by the
+``rebalance_item_ranks`` command).
+"""
+
+from django.conf import settings
+from django.db.models import Case, CharField, OuterRef, Q, Subquery, Value, When
+
+from .models import List, ListItem
+
+# Display order of a list's items; ``created_at`` and ``pk`` only break ties
+# between equal keys.
+ITEM_ORDER = ("rank", "created_at", "pk")
+
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+BASE = len(DIGITS)
+APPEND_WIDTH = 4
+
+
+def rank_between(before: str | None, after: str | None) -> str:
+    """Return a key that sorts strictly between *before* and *after*.
+
+    ``None`` stands for the start or end of the list.  *before* must sort
+    before *after*.
+    """
+    before = before or ""
+    if after is not None and after <= before:
+        raise ValueError(f"No rank between {before!r} and {after!r}.")
+
+    key = []
+    position = 0
+    while True:
+        low = DIGITS.index(before[position]) if position < len(before) else 0
+        if after is None:
+            high = BASE
+        else:
+            high = DIGITS.index(after[position]) if position < len(after) else 0
+
+        if low == high:
+            key.append(DIGITS[low])
+        elif high - low > 1:
+            key.append(DIGITS[(low + high) // 2])
+            return "".join(key)
+        else:
+            # Adjacent digits: keep the lower one and look for room further
+            # right, where the upper bound no longer applies.
+            key.append(DIGITS[low])
+            after = None
+        position += 1
+
+
+def rank_after(key: str | None) -> str:
+    """Return a key following *key* closely, for appending to the end of a list.
+
+    Rather than halving the remaining space (which lengthens keys on every
+    append), the key is read as a fixed-width number and incremented, so tens
+    of thousands of appends fit in four characters.
+    """
+    if key is None:
+        return rank_between(None, None)
+    width = max(len(key), APPEND_WIDTH)
+    value = 0
+    for digit in key.ljust(width, "0"):
+        value = value * BASE + DIGITS.index(digit)
+    if value + 1 == BASE ** width:
+        return key + DIGITS[BASE // 2]
+    value += 1
+    digits = []
+    for _ in range(width):
+        value, digit = divmod(value, BASE)
+        digits.append(DIGITS[digit])
+    return "".join(reversed(digits)).rstrip("0")
+
+
+def rank_sequence(count: int) -> list[str]:
+    """Return *count* evenly spaced, increasing keys of minimal length."""
+    width = 1
+    while BASE ** width < (count + 1) * 2:
+        width += 1
+    step = BASE ** width // (count + 1)
+    keys = []
+    for n in range(1, count + 1):
+        value = step * n
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        keys.append("".join(reversed(digits)).rstrip("0"))
+    return keys
+
+
+def items_from_last(list_id: int):
+    """Return ``(pk, rank)`` of the list's items, last displayed first.
+
+    Follows the ``(list, rank, created_at)`` index backwards.
+    """
+    return (
+        ListItem.objects.filter(list_id=list_id)
+        .order_by(*(f"-{field}" for field in ITEM_ORDER))
+        .values_list("pk", "rank")
+    )
+
+
+def last_item(list_id: int) -> tuple[int, str] | None:
+    """Return ``(pk, rank)`` of the list's last item."""
+    return items_from_last(list_id).first()
+
+
+def preceding_item() -> Subquery:
+    """Return a subquery for the pk of the item displayed directly above ``OuterRef``.
+
+    Follows ``ITEM_ORDER``, via the ``(list, rank, created_at)`` index.
+    """
+    rank, created_at = OuterRef("rank"), OuterRef("created_at")
+    return Subquery(
+        ListItem.objects.filter(list_id=OuterRef("list_id"))
+        .filter(
+            Q(rank__lt=rank)
+            | Q(rank=rank, created_at__lt=created_at)
+            | Q(rank=rank, created_at=created_at, pk__lt=OuterRef("pk"))
+        )
+        .order_by(*(f"-{field}" for field in ITEM_ORDER))
+        .values("pk")[:1]
+    )
+
+
+def lock_last_item(list_id: int) -> tuple[int, str] | None:
+    """Lock the list for an append and return ``(pk, rank)`` of its last item.
+
+    Must be called inside ``transaction.atomic()``, together with the
+    ``record_change`` that bumps the same list row's version.  Concurrent
+    appends wait for each other's commit, so each one reads the key the
+    previous one wrote and keys stay unique.
+    """
+    list(List.objects.select_for_update().filter(pk=list_id).values_list("pk"))
+    return last_item(list_id)
+
+
+def append_rank(list_id: int) -> str:
+    """Return a key placing a new item at the end of the list (see ``lock_last_item``)."""
+    last = lock_last_item(list_id)
+    return rank_after(last and last[1])
+
+
+def resequence(list_id: int, item_ids=None) -> None:
+    """Give every item of the list a fresh, evenly spaced key in one ``UPDATE``.
+
+    Items are placed in the order of *item_ids*; items missing from it (for
+    example added concurrently) follow in their current order.
+    """
+    current = list(
+        ListItem.objects.filter(list_id=list_id).values_list("pk", flat=True)
+    )
+    known = set(current)
+    ordered = list(dict.fromkeys(pk for pk in item_ids or () if pk in known))
+    placed = set(ordered)
+    ordered.extend(pk for pk in current if pk not in placed)
+    if not ordered:
+        return
+
+    keys = rank_sequence(len(ordered))
+    ListItem.objects.filter(list_id=list_id).update(
+        rank=Case(
+            *(When(pk=pk, then=Value(key)) for pk, key in zip(ordered, keys)),
+            output_field=CharField(),
+        )
+    )
+
+
+def move_item(item: ListItem, after_id: int | None) -> None:
+    """Move *item* directly below the item *after_id* (or to the top if ``None``).
+
+    Only the moved row is written unless its neighbours share a key or the
+    new key grows past ``LIST_RANK_MAX_LENGTH``, in which case the list is
+    resequenced instead.
+    """
+    siblings = ListItem.objects.filter(list_id=item.list_id).exclude(pk=item.pk)
+    following = siblings.order_by(*ITEM_ORDER)
+    before = None
+    if after_id is not None:
+        before = siblings.filter(pk=after_id).values_list("rank", flat=True).first()
+        if before is None:
+            raise ListItem.DoesNotExist(after_id)
+        following = following.filter(rank__gte=before).exclude(pk=after_id)
+    after = following.values_list("rank", flat=True).first()
+
+    if before is None or after is None or before < after:
+        rank = rank_between(before, after)
+        if len(rank) <= settings.LIST_RANK_MAX_LENGTH:
+            item.rank = rank
+            ListItem.objects.filter(pk=item.pk).update(rank=rank)
+            return
+
+    order = list(siblings.order_by(*ITEM_ORDER).values_list("pk", flat=True))
+    order.insert(order.index(after_id) + 1 if after_id is not None else 0, item.pk)
+    resequence(item.list_id, order)
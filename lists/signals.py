@@ -0,0 +1,43 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from .access import bump_membership_version
+from .changes import record_change
+from .models import Collaborator, List, ListChange
+
+
+@receiver(post_save, sender=Collaborator)
+def collaborator_saved(sender, instance, **kwargs):
+    bump_membership_version(instance.user_id)
+    # The list page shows its collaborators.
+    record_change(instance.list_id, ListChange.UPDATED)
+
+
+@receiver(post_delete, sender=Collaborator)
+def collaborator_deleted(sender, instance, **kwargs):
+    bump_membership_version(instance.user_id)
+    # Deleting a list (or its owner) removes the collaborators first; logging
+    # the change after commit skips lists that no longer exist by then.
+    transaction.on_commit(partial(record_change, instance.list_id, ListChange.UPDATED))
+
+
+@receiver(post_init, sender=List)
+def remember_list_owner(sender, instance, **kwargs):
+    instance._loaded_owner_id = instance.owner_id
+
+
+@receiver(post_save, sender=List)
+def list_saved(sender, instance, created, **kwargs):
+    if created or instance.owner_id != instance._loaded_owner_id:
+        bump_membership_version(
+            *{instance.owner_id, instance._loaded_owner_id} - {None}
+        )
+    instance._loaded_owner_id = instance.owner_id
+
+
+@receiver(post_delete, sender=List)
+def list_deleted(sender, instance, **kwargs):
+    bump_membership_version(instance.owner_id)
@@ -0,0 +1,12 @@
+from django import template
+
+from ..fragments import row_fragments
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def item_rows(context, rows, lst):
+    """Render ``partials/item_row.html`` for every row, from the fragment cache."""
+    user = context["request"].user
+    return row_fragments.render(rows, lst, user.preferred_language)
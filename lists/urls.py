@@ -13,10 +13,13 @@ urlpatterns = [
     path("<int:pk>/pin/", views.list_pin_toggle, name="list_pin_toggle"),
     path("<int:pk>/archive/", views.list_archive_toggle, name="list_archive_toggle"),
     path("<int:pk>/delete/", views.list_delete, name="list_delete"),
+    path("<int:pk>/changes/", views.list_changes, name="list_changes"),
+    path("<int:pk>/events/", views.list_events, name="list_events"),
+    path("<int:pk>/items/", views.item_window, name="item_window"),
     path("<int:pk>/items/add/", views.item_add, name="item_add"),
+    path("<int:pk>/items/translate/stream/", views.item_translate_stream, name="item_translate_stream"),
     path("<int:pk>/items/reorder/", views.item_reorder, name="item_reorder"),
     path("<int:pk>/items/<int:item_pk>/toggle/", views.item_toggle, name="item_toggle"),
-    path("<int:pk>/items/<int:item_pk>/translate/", views.item_translate, name="item_translate"),
     path("<int:pk>/items/<int:item_pk>/delete/", views.item_delete, name="item_delete"),
     path(
         "<int:pk>/collaborators/<int:collab_pk>/remove/",
@@ -1,48 +1,213 @@
+import hashlib
 import json
+import time
+from datetime import datetime
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.db import models
-from django.http import HttpResponse
+from django.db import connection, models, transaction
+from django.http import HttpResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.template.loader import render_to_string
+from django.middleware.csrf import get_token
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
-from django.views.decorators.http import require_POST
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_POST
+from django_htmx.http import reswap, retarget
+
+from translations.cache import translation_cache
+from translations.queue import enqueue_items, enqueue_list
+from translations.services import (
+    ItemRow,
+    get_item_row,
+    item_rows,
+    translate_items,
+    with_cached_translations,
+)
+
+from .access import OWNER, get_list_for_user, member_list_version
+from .forms import ListForm, ListItemForm, ListTitleForm
+from .changes import changed_items, record_change
+from .events import get_event_bus, stream_slots
+from .models import Collaborator, List, ListChange, ListItem
+from .pagination import keyset_paginate
+from .ranking import ITEM_ORDER, lock_last_item, move_item, preceding_item, rank_after, resequence
 
-from translations.services import get_items_for_user, get_translated_text
 
-from .forms import ListForm, ListItemForm, ListTitleForm
-from .models import Collaborator, List, ListItem
+ITEM_WINDOW_KEYS = [("rank", str), ("created_at", datetime), ("pk", int)]
+LIST_INDEX_KEYS = [("is_pinned", bool), ("updated_at", datetime), ("pk", int)]
+LIST_ARCHIVED_KEYS = [("updated_at", datetime), ("pk", int)]
 
 
-@login_required
-def list_index(request):
-    """Show all non-archived lists the user owns or collaborates on."""
-    owned = List.objects.filter(owner=request.user)
-    collaborated = List.objects.filter(collaborators__user=request.user)
-    all_lists = (owned | collaborated).distinct().filter(is_archived=False)
+def window_items(lst, user):
+    """Return the items of *lst* that item windows page through, for *user*."""
+    return with_cached_translations(lst.items.select_related("added_by"), user)
 
-    # Annotate with is_pinned and order pinned first, then by updated_at
-    all_lists = all_lists.annotate(
+
+def index_lists(user):
+    """Return the non-archived lists *user* owns or collaborates on, for the overview."""
+    lists = List.objects.filter(
+        models.Q(owner=user)
+        | models.Q(pk__in=Collaborator.objects.filter(user=user).values("list_id")),
+        is_archived=False,
+    ).annotate(
         is_pinned=models.Exists(
             List.pinned_by.through.objects.filter(
-                list_id=models.OuterRef("pk"), user_id=request.user.id
+                list_id=models.OuterRef("pk"), user_id=user.id
             )
+        ),
+        has_archived=models.Exists(List.objects.filter(owner=user, is_archived=True)),
+    )
+    return _with_item_counts(lists)
+
+
+def archived_lists(user):
+    """Return the archived lists *user* owns, for the archive overview."""
+    return _with_item_counts(List.objects.filter(owner=user, is_archived=True))
+
+
+def _with_item_counts(lists):
+    """Annotate *lists* with item counts, one indexed subquery per count.
+
+    Counting through a join would group the whole page in a temporary table.
+    """
+    items = ListItem.objects.filter(list=models.OuterRef("pk")).order_by()
+
+    def count(queryset):
+        return models.Subquery(
+            queryset.annotate(count=models.Func("pk", function="COUNT")).values("count"),
+            output_field=models.IntegerField(),
         )
-    ).order_by("-is_pinned", "-updated_at")
 
-    has_archived = List.objects.filter(owner=request.user, is_archived=True).exists()
+    return lists.select_related("owner").annotate(
+        item_count=count(items),
+        unchecked_count=count(items.filter(is_checked=False)),
+    )
 
-    return render(request, "lists/index.html", {"lists": all_lists, "has_archived": has_archived})
+
+def _item_window(request, lst, after=None):
+    """Return the template context for one window of items following cursor *after*."""
+    page = keyset_paginate(
+        window_items(lst, request.user),
+        ITEM_WINDOW_KEYS,
+        after,
+        settings.LIST_ITEM_WINDOW_SIZE,
+        descending=False,
+    )
+    rows = item_rows(page.items, request.user)
+    return {
+        "items": rows,
+        "list": lst,
+        "has_pending": any(entry.translation_pending for entry in rows),
+        "window_after": after or "",
+        "next_cursor": page.next_cursor,
+    }
+
+
+def _list_etag(request, pk, **kwargs):
+    """Return the ETag of a list page or item window for the requesting user.
+
+    Derived from the list's ``version``, the viewer's item and UI languages
+    and the CSRF secret, so a matching ``If-None-Match`` is answered with 304
+    after the single access query.  The secret changes on login; without it
+    a revalidated page would keep posting a stale CSRF token.  Pages
+    carrying flash messages are not cached.
+    """
+    lst, role = get_list_for_user(request, pk)
+    if role is None or len(messages.get_messages(request)):
+        return None
+    user = request.user
+    # get_token() returns a differently masked token each call; hash the
+    # secret it makes sure exists instead.
+    get_token(request)
+    csrf_secret = request.META["CSRF_COOKIE"]
+    key = (
+        f"{lst.pk}:{lst.version}:{user.pk}:{user.preferred_language}:"
+        f"{get_language()}:{csrf_secret}"
+    )
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def _changes_context(request, lst, since):
+    """Return the template context for the item changes after version *since*.
+
+    Changed rows come with ``previous_id``, the item now displayed above
+    them.  Falls back to the first item window (``resync``) when the change
+    log no longer reaches back to *since* or the changes are too many.
+    """
+    context = {"list": lst}
+    item_ids = changed_items(lst, since)
+    if item_ids is not None and len(item_ids) <= settings.LIST_ITEM_WINDOW_SIZE:
+        items = lst.items.filter(pk__in=item_ids).select_related("added_by")
+        items = with_cached_translations(
+            items.annotate(previous_id=preceding_item()).order_by(*ITEM_ORDER),
+            request.user,
+        )
+        rows = item_rows(items, request.user)
+        # An emptied list needs its placeholder, i.e. a full render.
+        if len(rows) == len(item_ids) or rows or lst.items.exists():
+            return {**context, "removed": item_ids, "rows": rows}
+    return {**context, **_item_window(request, lst), "resync": True}
+
+
+def _render_partial(request, template_name, context):
+    """Render a hot HTMX partial with the engine named by ``PARTIALS_TEMPLATE_ENGINE``."""
+    return render(request, template_name, context, using=settings.PARTIALS_TEMPLATE_ENGINE)
+
+
+def _render_item_list(request, lst):
+    """Render the item list partial (its first window) for the current user."""
+    return _render_partial(request, "partials/item_list.html", _item_window(request, lst))
+
+
+def _is_last_shown(request, item_id):
+    """Return whether *item_id* is the last row on the requesting page."""
+    return request.POST.get("last_item_id", "") == str(item_id)
+
+
+def _is_partial(request):
+    """Return whether the requesting page has not loaded every item window yet."""
+    return request.POST.get("last_item_id") == "partial"
+
+
+def _list_page(request, lists, keys):
+    """Return the requested keyset page of *lists*."""
+    return keyset_paginate(lists, keys, request.GET.get("after"), settings.LIST_INDEX_PAGE_SIZE)
+
+
+@login_required
+def list_index(request):
+    """Show all non-archived lists the user owns or collaborates on.
+
+    Membership, pinned state, item counts and whether the user has archived
+    lists come from a single query per page.  Later pages are loaded by an
+    infinite-scroll sentinel, which gets only the cards partial.
+    """
+    user = request.user
+    page = _list_page(request, index_lists(user), LIST_INDEX_KEYS)
+    context = {"lists": page.items, "page": page}
+
+    if request.htmx:
+        return render(request, "partials/list_cards.html", context)
+
+    if page.items:
+        context["has_archived"] = page.items[0].has_archived
+    else:
+        context["has_archived"] = List.objects.filter(owner=user, is_archived=True).exists()
+    return render(request, "lists/index.html", context)
 
 
 @login_required
 def list_archived(request):
-    """Show all archived lists owned by the current user."""
-    archived_lists = List.objects.filter(
-        owner=request.user, is_archived=True
-    ).order_by("-updated_at")
+    """Show all archived lists owned by the current user, a page at a time."""
+    page = _list_page(request, archived_lists(request.user), LIST_ARCHIVED_KEYS)
+    context = {"lists": page.items, "page": page}
 
-    return render(request, "lists/archived.html", {"lists": archived_lists})
+    if request.htmx:
+        return render(request, "partials/archived_list_cards.html", context)
+    return render(request, "lists/archived.html", context)
 
 
 @login_required
@@ -52,6 +217,7 @@ def list_archive_toggle(request, pk):
     lst = get_object_or_404(List, pk=pk, owner=request.user)
     lst.is_archived = not lst.is_archived
     lst.save(update_fields=["is_archived"])
+    record_change(lst.pk, ListChange.UPDATED)
 
     if lst.is_archived:
         messages.success(
@@ -71,8 +237,8 @@ def list_archive_toggle(request, pk):
 @require_POST
 def list_pin_toggle(request, pk):
     """Toggle pinned status of a list for the current user."""
-    lst = get_object_or_404(List, pk=pk)
-    if not lst.is_member(request.user):
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
         return HttpResponse(status=403)
 
     if lst.pinned_by.filter(pk=request.user.pk).exists():
@@ -99,14 +265,21 @@ def list_create(request):
 
 
 @login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_list_etag)
 def list_detail(request, pk):
-    """View a single list with its items (translated for the current user)."""
-    lst = get_object_or_404(List, pk=pk)
-    if not lst.is_member(request.user):
+    """View a single list with its items (translated for the current user).
+
+    Only the first ``LIST_ITEM_WINDOW_SIZE`` items are rendered; further
+    windows are fetched from ``item_window`` as the user scrolls.  Both
+    answer revalidations of an unchanged list with 304 (see ``_list_etag``).
+    """
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
         messages.error(request, _("You don't have access to this list."))
         return redirect("lists:list_index")
 
-    is_owner = lst.owner == request.user
+    is_owner = role == OWNER
 
     # Collaborators cannot access archived lists
     if lst.is_archived and not is_owner:
@@ -115,23 +288,126 @@ def list_detail(request, pk):
 
     item_form = ListItemForm()
     title_form = ListTitleForm(instance=lst) if is_owner and not lst.is_archived else None
-    items = get_items_for_user(lst, request.user)
     collaborators = lst.collaborators.select_related("user").all()
 
     return render(
         request,
         "lists/detail.html",
         {
-            "list": lst,
-            "items": items,
+            **_item_window(request, lst),
             "item_form": item_form,
             "title_form": title_form,
             "collaborators": collaborators,
             "is_owner": is_owner,
+            "poll_interval": settings.LIST_CHANGES_POLL_INTERVAL,
+            "push_changes": get_event_bus() is not None,
         },
     )
 
 
+@login_required
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=_list_etag)
+def item_window(request, pk):
+    """Return the window of rows following the ``after`` cursor (infinite scroll)."""
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
+        return HttpResponse(status=403)
+
+    return _render_partial(
+        request,
+        "partials/item_window.html",
+        _item_window(request, lst, request.GET.get("after")),
+    )
+
+
+@login_required
+def list_changes(request, pk):
+    """Return the item changes after version ``since`` (HTMX polling endpoint).
+
+    Rows changed since then are rendered for the viewer and sent as
+    out-of-band swaps: each is removed and re-inserted below the item now
+    preceding it, so replaying a change is harmless; deleted rows are only
+    removed.  The main content is the poller, carrying the current version.
+    Responds 204 when nothing changed, and re-renders the first item window
+    when the change log no longer reaches back to ``since``.
+    """
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
+        return HttpResponse(status=403)
+    try:
+        since = int(request.GET["since"])
+    except (KeyError, ValueError):
+        return HttpResponse(status=400)
+    if since == lst.version:
+        return HttpResponse(status=204)
+
+    return render(
+        request,
+        "partials/list_changes.html",
+        {**_changes_context(request, lst, since), "poll_interval": settings.LIST_CHANGES_POLL_INTERVAL},
+    )
+
+
+@login_required
+def list_events(request, pk):
+    """Push the list's item changes to the page as they are committed (SSE endpoint).
+
+    Starts from the version in ``Last-Event-ID`` (sent by reconnecting
+    browsers) or ``since``.  Each ``changes`` event carries the row swaps of
+    ``list_changes`` and the new version as its id; comments keep idle
+    connections open.  The stream ends after ``LIST_EVENTS_MAX_AGE`` seconds,
+    and the browser reconnects, or when the user loses access.  Membership is
+    checked in the database on open and on every wake-up, since a stream
+    outlives the cached access map.  Responds 204 when push is off or every
+    stream slot of this process is taken; the page then polls
+    ``list_changes`` instead.
+    """
+    lst = get_object_or_404(List, pk=pk)
+    if member_list_version(request.user, lst.pk) is None:
+        return HttpResponse(status=403)
+    try:
+        since = int(request.headers.get("Last-Event-ID") or request.GET["since"])
+    except (KeyError, ValueError):
+        return HttpResponse(status=400)
+    bus = get_event_bus()
+    if bus is None:
+        return HttpResponse(status=204)
+    slots = stream_slots()
+    if not slots.acquire(blocking=False):
+        return HttpResponse(status=204)
+
+    subscription = bus.subscribe(lst.pk)
+    deadline = time.monotonic() + settings.LIST_EVENTS_MAX_AGE
+
+    def events():
+        nonlocal since
+        while time.monotonic() < deadline:
+            lst.version = member_list_version(request.user, lst.pk)
+            if lst.version is None:
+                return
+            if lst.version != since:
+                rows = render_to_string(
+                    "partials/list_change_rows.html",
+                    _changes_context(request, lst, since),
+                    request=request,
+                )
+                since = lst.version
+                rows = "\n".join(line for line in rows.splitlines() if line.strip())
+                yield _sse_event("changes", rows, event_id=since)
+            else:
+                yield ": keepalive\n\n"
+            # Do not hold a database connection while idle.
+            connection.close()
+            subscription.wait(settings.LIST_EVENTS_KEEPALIVE)
+
+    def close():
+        subscription.close()
+        slots.release()
+
+    return _sse_response(events(), close)
+
+
 @login_required
 @require_POST
 def list_rename(request, pk):
@@ -145,6 +421,7 @@ def list_rename(request, pk):
     if form.is_valid():
         if form.has_changed():
             form.save()
+            record_change(lst.pk, ListChange.UPDATED)
             messages.success(request, _("List updated."))
         else:
             messages.info(request, _("No changes made."))
@@ -161,43 +438,65 @@ def list_rename(request, pk):
 @login_required
 @require_POST
 def item_add(request, pk):
-    """Add an item to a list (HTMX endpoint)."""
-    lst = get_object_or_404(List, pk=pk)
-    if not lst.is_member(request.user):
+    """Add an item to a list (HTMX endpoint).
+
+    Responds with just the new row, appended to ``#item-list``.  The whole
+    list is re-rendered instead when the page's last row (sent as
+    ``last_item_id``) is no longer the item the new one follows, e.g. after
+    a collaborator added items, or when the list was empty.  An invalid form
+    is answered with 422 and swapped back in with its errors.
+    """
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
         return HttpResponse(status=403)
     if lst.is_archived:
         return HttpResponse(status=403)
 
     form = ListItemForm(request.POST)
-    if form.is_valid():
-        item = form.save(commit=False)
-        item.list = lst
-        item.added_by = request.user
-        item.source_language = request.user.preferred_language
-        # Set order to be at the end
-        max_order = lst.items.aggregate(models.Max("order"))["order__max"] or 0
-        item.order = max_order + 1
+    if not form.is_valid():
+        response = render(
+            request,
+            "partials/item_add_form.html",
+            {"item_form": form, "list": lst},
+            status=422,
+        )
+        return retarget(reswap(response, "outerHTML"), "#add-item-form")
+
+    item = form.save(commit=False)
+    item.list = lst
+    item.added_by = request.user
+    item.source_language = request.user.preferred_language
+    with transaction.atomic():
+        previous = lock_last_item(lst.pk)
+        item.rank = rank_after(previous and previous[1])
         item.save()
-        lst.save()  # bump updated_at
-
-    # Return the full updated item list for this user
-    items = get_items_for_user(lst, request.user)
-    return render(
+        record_change(lst.pk, ListChange.ADDED, item.pk, touch=True)
+    enqueue_items([item])
+
+    if _is_partial(request):
+        # The new row belongs after windows the page has not loaded yet.
+        return HttpResponse(status=204)
+    if previous is None or not _is_last_shown(request, previous[0]):
+        return reswap(_render_item_list(request, lst), "innerHTML")
+    return _render_partial(
         request,
-        "partials/item_list.html",
-        {
-            "items": items,
-            "list": lst,
-        },
+        "partials/item_row.html",
+        {"entry": ItemRow(item, item.text), "list": lst},
     )
 
 
 @login_required
 @require_POST
 def item_toggle(request, pk, item_pk):
-    """Toggle an item's checked status (HTMX endpoint)."""
-    lst = get_object_or_404(List, pk=pk)
-    if not lst.is_member(request.user):
+    """Toggle an item's checked status (HTMX endpoint).
+
+    Responds with the updated row only.  Checking an item moves it to the
+    bottom: the row is removed in place and appended to ``#item-list``
+    out-of-band, unless the page's last row differs from the server's, in
+    which case the whole list is re-rendered.
+    """
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
         return HttpResponse(status=403)
     if lst.is_archived:
         return HttpResponse(status=403)
@@ -206,100 +505,185 @@ def item_toggle(request, pk, item_pk):
     item.is_checked = not item.is_checked
 
     # When checking an item, move it to the end of the manual sort order.
-    if item.is_checked:
-        max_order = (
-            ListItem.objects.filter(list=lst).exclude(pk=item.pk).aggregate(models.Max("order"))["order__max"] or 0
-        )
-        item.order = max_order + 1
-        item.save(update_fields=["is_checked", "order"])
-    else:
-        item.save(update_fields=["is_checked"])
+    previous = None
+    with transaction.atomic():
+        if item.is_checked:
+            last = lock_last_item(lst.pk)
+            if last[0] != item.pk:
+                previous = last
+                item.rank = rank_after(last[1])
+            item.save(update_fields=["is_checked", "rank"])
+        else:
+            item.save(update_fields=["is_checked"])
+        op = ListChange.CHECKED if item.is_checked else ListChange.UNCHECKED
+        record_change(lst.pk, op, item.pk)
 
-    items = get_items_for_user(lst, request.user)
-    return render(
-        request,
-        "partials/item_list.html",
-        {
-            "items": items,
-            "list": lst,
-        },
-    )
+    context = {"entry": get_item_row(item, request.user), "list": lst}
+    if previous is None:
+        return _render_partial(request, "partials/item_row.html", context)
+    if _is_partial(request):
+        # Drop the row; it reappears at the end once the last window loads.
+        return HttpResponse()
+    if not _is_last_shown(request, previous[0]):
+        return retarget(reswap(_render_item_list(request, lst), "innerHTML"), "#item-list")
+    return render(request, "partials/item_row_append.html", context)
 
 
 @login_required
 @require_POST
 def item_delete(request, pk, item_pk):
-    """Delete an item from a list (HTMX endpoint)."""
-    lst = get_object_or_404(List, pk=pk)
-    if not lst.is_member(request.user):
+    """Delete an item from a list (HTMX endpoint); the emptied row is swapped out."""
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
         return HttpResponse(status=403)
     if lst.is_archived:
         return HttpResponse(status=403)
 
     item = get_object_or_404(ListItem, pk=item_pk, list=lst)
+    translation_cache.invalidate_item(item)
     item.delete()
+    record_change(lst.pk, ListChange.DELETED, item_pk)
 
-    items = get_items_for_user(lst, request.user)
-    return render(
-        request,
-        "partials/item_list.html",
-        {
-            "items": items,
-            "list": lst,
-        },
-    )
+    # Removing the row is enough unless the empty-list message must appear.
+    if not lst.items.exists():
+        return retarget(reswap(_render_item_list(request, lst), "innerHTML"), "#item-list")
+    return HttpResponse()
 
 
 @login_required
 @require_POST
 def item_reorder(request, pk):
-    """Reorder items in a list (HTMX/AJAX endpoint)."""
-    lst = get_object_or_404(List, pk=pk)
-    if not lst.is_member(request.user):
+    """Reorder items in a list (HTMX/AJAX endpoint).
+
+    Accepts ``{"moves": [{"item_id": ..., "after_id": ...}]}``, placing each
+    item directly below ``after_id`` (``null`` for the top); only the moved
+    rows are written.  The older ``{"item_ids": [...]}`` form resequences
+    the whole list in one statement.
+    """
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
         return HttpResponse(status=403)
     if lst.is_archived:
         return HttpResponse(status=403)
 
     try:
         data = json.loads(request.body)
-        item_ids = data.get("item_ids", [])
-    except json.JSONDecodeError:
+        moves = [
+            (int(move["item_id"]), None if move.get("after_id") is None else int(move["after_id"]))
+            for move in data.get("moves", [])
+        ]
+        item_ids = [int(item_id) for item_id in data.get("item_ids", [])]
+    except (json.JSONDecodeError, AttributeError, KeyError, TypeError, ValueError):
         return HttpResponse(status=400)
 
-    # Update order for each item
-    for index, item_id in enumerate(item_ids):
-        ListItem.objects.filter(pk=item_id, list=lst).update(order=index)
+    moved = []
+    with transaction.atomic():
+        if item_ids:
+            resequence(lst.pk, item_ids)
+            moved.extend(item_ids)
+        for item_id, after_id in moves:
+            item = ListItem.objects.filter(pk=item_id, list=lst).first()
+            if item is None or item_id == after_id:
+                continue
+            try:
+                move_item(item, after_id)
+            except ListItem.DoesNotExist:
+                return HttpResponse(status=400)
+            moved.append(item_id)
+        if moved:
+            record_change(lst.pk, ListChange.MOVED, *dict.fromkeys(moved))
 
     return HttpResponse(status=204)
 
 
-@login_required
-@require_POST
-def item_translate(request, pk, item_pk):
-    """Translate a single item and return its rendered row (HTMX endpoint)."""
-    lst = get_object_or_404(List, pk=pk)
-    if not lst.is_member(request.user):
-        return HttpResponse(status=403)
+class _ClosingStream:
+    """Streaming content that runs *on_close* once the response is closed.
 
-    item = get_object_or_404(ListItem, pk=item_pk, list=lst)
-    target = request.user.preferred_language
+    The server closes the response even when the client left before the
+    generator started, when cleanup inside the generator would never run.
+    """
 
-    display_text = get_translated_text(item, target)
-    is_translated = item.source_language != target and display_text != item.text
+    def __init__(self, iterator, on_close):
+        self._iterator = iterator
+        self._on_close = on_close
 
-    return render(
-        request,
-        "partials/item_row.html",
-        {
-            "entry": {
-                "item": item,
-                "display_text": display_text,
-                "is_translated": is_translated,
-                "translation_pending": False,
-            },
-            "list": lst,
-        },
+    def __iter__(self):
+        return self._iterator
+
+    def close(self):
+        try:
+            self._iterator.close()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+def _sse_response(events, on_close):
+    """Return a Server-Sent Events response streaming *events*."""
+    response = StreamingHttpResponse(
+        _ClosingStream(events, on_close), content_type="text/event-stream"
     )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _sse_event(event, data="", event_id=None):
+    """Format one Server-Sent Events message."""
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+@login_required
+def item_translate_stream(request, pk):
+    """Stream translated rows to the current user as they become ready (SSE endpoint).
+
+    Holds a single connection per rendered item window (selected by the
+    ``after`` cursor) instead of one request per pending item.  Pending items
+    are translated in small batches in display order (checked items last) and
+    each finished row is sent as a ``row`` event carrying an out-of-band
+    ``item_row.html`` fragment; a final ``done`` event closes the stream.
+    Responds 503 while every stream slot of this process is taken; the
+    browser retries with a growing delay.
+    """
+    lst, role = get_list_for_user(request, pk)
+    if role is None:
+        return HttpResponse(status=403)
+
+    target = request.user.preferred_language
+    window = _item_window(request, lst, request.GET.get("after"))
+    pending = [entry.item for entry in window["items"] if entry.translation_pending]
+    pending.sort(key=lambda item: item.is_checked)
+    chunk_size = settings.TRANSLATION_STREAM_CHUNK_SIZE
+    slots = stream_slots()
+    if not slots.acquire(blocking=False):
+        response = HttpResponse(status=503)
+        response["Retry-After"] = "5"
+        return response
+
+    def events():
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            translated = translate_items(chunk, target)
+            for item in chunk:
+                row = render_to_string(
+                    "partials/item_row.html",
+                    {
+                        "entry": ItemRow.translated(item, translated.get(item.pk, item.text)),
+                        "list": lst,
+                        "oob": True,
+                    },
+                    request=request,
+                    using=settings.PARTIALS_TEMPLATE_ENGINE,
+                )
+                yield _sse_event("row", row.strip())
+        yield _sse_event("done")
+
+    return _sse_response(events(), slots.release)
 
 
 @login_required
@@ -314,12 +698,13 @@ def list_join(request, token):
         )
         return redirect("lists:list_index")
 
-    if lst.owner == request.user:
+    if lst.owner_id == request.user.pk:
         messages.info(request, _("You already own this list."))
         return redirect("lists:list_detail", pk=lst.pk)
 
-    _, created = Collaborator.objects.get_or_create(list=lst, user=request.user)
+    collaborator, created = Collaborator.objects.get_or_create(list=lst, user=request.user)
     if created:
+        enqueue_list(lst)
         messages.success(
             request,
             _('You joined "%(title)s"!') % {"title": lst.title},
@@ -339,7 +724,7 @@ def collaborator_remove(request, pk, collab_pk):
     collab.delete()
 
     collaborators = lst.collaborators.select_related("user").all()
-    return render(
+    return _render_partial(
         request,
         "partials/collaborator_list.html",
         {
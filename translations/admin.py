@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import LanguagePair
+from .models import LanguagePair, TranslationJob, TranslationMemory
 
 
 @admin.register(LanguagePair)
@@ -10,3 +10,17 @@ class LanguagePairAdmin(admin.ModelAdmin):
     list_editable = ("enabled",)
     search_fields = ("source_name", "target_name", "source_code", "target_code")
     ordering = ("source_name", "target_name")
+
+
+@admin.register(TranslationJob)
+class TranslationJobAdmin(admin.ModelAdmin):
+    list_display = ("item", "status", "attempts", "created_at", "claimed_at", "run_after")
+    list_filter = ("status",)
+    raw_id_fields = ("item",)
+
+
+@admin.register(TranslationMemory)
+class TranslationMemoryAdmin(admin.ModelAdmin):
+    list_display = ("source_text", "translated_text", "source_language", "target_language", "hit_count")
+    list_filter = ("source_language", "target_language")
+    search_fields = ("source_text", "translated_text")
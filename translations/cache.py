@@ -0,0 +1,182 @@
+"""In-memory tiers in front of the ``TranslationCache`` table.
+
+Lookups go through a bounded per-process LRU first, then (optionally) a
+Django cache-framework backend shared between workers, and only then the
+database.  Every insert into ``TranslationCache`` is written through to both
+tiers, and deleting an item invalidates its entries explicitly.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Rough per-entry bookkeeping cost (key tuple, OrderedDict node, expiry)
+# added to the encoded size of the translation when sizing the LRU.
+ENTRY_OVERHEAD_BYTES = 200
+
+
+class LRUCache:
+    """A thread-safe LRU bounded by entry count and by approximate bytes, with a TTL."""
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _size(value: str) -> int:
+        return len(value.encode("utf-8")) + ENTRY_OVERHEAD_BYTES
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value: str) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._bytes += self._size(value)
+            while self._data and (
+                len(self._data) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def delete(self, key) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _remove(self, key) -> None:
+        value, _ = self._data.pop(key)
+        self._bytes -= self._size(value)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class TranslationCacheTiers:
+    """Read-through/write-through tiers for ``(item_id, source, target)`` lookups."""
+
+    def __init__(self):
+        self.local = LRUCache(
+            max_entries=settings.TRANSLATION_CACHE_LRU_MAX_ENTRIES,
+            max_bytes=settings.TRANSLATION_CACHE_LRU_MAX_BYTES,
+            ttl=settings.TRANSLATION_CACHE_LRU_TTL,
+        )
+        self.shared_hits = 0
+        self.shared_misses = 0
+
+    @property
+    def shared(self):
+        alias = settings.TRANSLATION_CACHE_ALIAS
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def _shared_key(key) -> str:
+        item_id, source, target = key
+        return f"translations:tc:{item_id}:{source}:{target}"
+
+    def get_many(self, keys) -> dict:
+        """Return cached translations for *keys*; missing keys are omitted."""
+        found = {}
+        missing = []
+        for key in keys:
+            value = self.local.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+
+        shared = self.shared
+        if shared is not None and missing:
+            shared_keys = {self._shared_key(key): key for key in missing}
+            values = shared.get_many(shared_keys)
+            self.shared_hits += len(values)
+            self.shared_misses += len(missing) - len(values)
+            for shared_key, value in values.items():
+                key = shared_keys[shared_key]
+                found[key] = value
+                self.local.set(key, value)
+
+        return found
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def set_many(self, mapping: dict) -> None:
+        """Store ``key -> translation`` pairs in every tier."""
+        for key, value in mapping.items():
+            self.local.set(key, value)
+        shared = self.shared
+        if shared is not None and mapping:
+            shared.set_many(
+                {self._shared_key(key): value for key, value in mapping.items()},
+                timeout=settings.TRANSLATION_CACHE_SHARED_TTL,
+            )
+
+    def delete_many(self, keys) -> None:
+        keys = list(keys)
+        for key in keys:
+            self.local.delete(key)
+        shared = self.shared
+        if shared is not None and keys:
+            shared.delete_many([self._shared_key(key) for key in keys])
+
+    def invalidate_item(self, item) -> None:
+        """Drop every cached translation of *item*; call before deleting it."""
+        self.delete_many(
+            (item.pk, source, target)
+            for source, target in item.translations.values_list(
+                "source_language", "target_language"
+            )
+        )
+
+    def stats(self) -> dict:
+        return {
+            "local": self.local.stats(),
+            "shared": {
+                "alias": settings.TRANSLATION_CACHE_ALIAS,
+                "hits": self.shared_hits,
+                "misses": self.shared_misses,
+            },
+        }
+
+
+translation_cache = TranslationCacheTiers()
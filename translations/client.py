@@ -1,21 +1,236 @@
 """Client for the LibreTranslate API."""
 
 import logging
+import os
+import threading
+import time
 
 import requests
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+from .cache import LRUCache
 
 logger = logging.getLogger(__name__)
 
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with a bounded connection pool and retries.
+
+    Translation requests are idempotent, so POST is retried along with the
+    usual idempotent verbs on connection errors and transient 429/5xx replies,
+    using jittered exponential backoff.
+    """
+    retry = Retry(
+        total=settings.LIBRETRANSLATE_MAX_RETRIES,
+        backoff_factor=settings.LIBRETRANSLATE_BACKOFF_FACTOR,
+        backoff_jitter=settings.LIBRETRANSLATE_BACKOFF_JITTER,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=settings.LIBRETRANSLATE_POOL_SIZE,
+        pool_maxsize=settings.LIBRETRANSLATE_POOL_SIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the per-process pooled HTTP session used to talk to LibreTranslate.
+
+    The session is rebuilt after a fork so gunicorn workers never share
+    sockets inherited from the master process.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                _session = _build_session()
+                _session_pid = pid
+    return _session
+
+
+def get_timeout() -> tuple[float, float]:
+    """Return the ``(connect, read)`` timeout pair for LibreTranslate requests."""
+    return (
+        settings.LIBRETRANSLATE_CONNECT_TIMEOUT,
+        settings.LIBRETRANSLATE_READ_TIMEOUT,
+    )
+
+
+class CircuitBreaker:
+    """Fail fast after repeated failures, then probe with half-open requests.
+
+    The circuit opens after ``threshold`` consecutive failures.  Once
+    ``reset_timeout`` seconds have passed a single probe request is let
+    through (half-open); its success closes the circuit, its failure opens it
+    again for another ``reset_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, threshold: int, reset_timeout: float):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def is_open(self) -> bool:
+        """Return whether calls are currently being refused (without probing)."""
+        with self._lock:
+            return self.state == self.OPEN and (
+                time.monotonic() - self.opened_at < self.reset_timeout
+            )
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed, taking the probe slot if half-open."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        "LibreTranslate circuit opened after %d failure(s).", self.failures
+                    )
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+_failed_texts = None
+
+
+def _breaker(key) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = _breakers[key] = CircuitBreaker(
+                settings.LIBRETRANSLATE_CIRCUIT_THRESHOLD,
+                settings.LIBRETRANSLATE_CIRCUIT_RESET_TIMEOUT,
+            )
+        return breaker
+
+
+def _breakers_for(source: str, target: str) -> tuple[CircuitBreaker, CircuitBreaker]:
+    """Return the (backend, language pair) breakers for the configured server."""
+    backend = settings.LIBRETRANSLATE_URL
+    return _breaker((backend,)), _breaker((backend, source, target))
+
+
+def _negative_cache() -> LRUCache:
+    """Return the per-process cache of recently failed (text, pair) combinations."""
+    global _failed_texts
+    if _failed_texts is None:
+        _failed_texts = LRUCache(
+            max_entries=settings.TRANSLATION_NEGATIVE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.TRANSLATION_NEGATIVE_CACHE_MAX_ENTRIES * 1024,
+            ttl=settings.TRANSLATION_NEGATIVE_CACHE_TTL,
+        )
+    return _failed_texts
+
+
+def _allow(source: str, target: str) -> bool:
+    backend, pair = _breakers_for(source, target)
+    return backend.allow() and pair.allow()
+
+
+def _record(source: str, target: str, *, error: Exception | None = None, texts=()) -> None:
+    """Feed the outcome of a request into the breakers and the negative cache.
+
+    Client errors (4xx) only count against the language pair; connection
+    problems and server errors count against the whole backend as well.
+    """
+    backend, pair = _breakers_for(source, target)
+    if error is None:
+        backend.record_success()
+        pair.record_success()
+        return
+
+    status = getattr(getattr(error, "response", None), "status_code", None)
+    if status is not None and status < 500:
+        backend.record_success()
+    else:
+        backend.record_failure()
+    pair.record_failure()
+
+    failed = _negative_cache()
+    for text in texts:
+        failed.set((text, source, target), "")
+
+
+def is_backend_unavailable() -> bool:
+    """Return whether the circuit for the configured LibreTranslate server is open."""
+    return _breaker((settings.LIBRETRANSLATE_URL,)).is_open()
+
+
+def is_translation_unavailable(text: str, source: str, target: str) -> bool:
+    """Return whether translating *text* would currently fail fast.
+
+    True when the combination failed recently or the circuit for the backend
+    or language pair is open.  Callers use it to show the original text right
+    away instead of queueing a doomed request.
+    """
+    if source == target:
+        return False
+    if _negative_cache().get((text, source, target)) is not None:
+        return True
+    backend, pair = _breakers_for(source, target)
+    return backend.is_open() or pair.is_open()
+
 
 def translate_text(text: str, source: str, target: str) -> str | None:
     """Translate *text* from *source* language to *target* language.
 
-    Returns the translated string, or ``None`` if the request fails.
+    Returns the translated string, or ``None`` if the request fails or is
+    refused because the text failed recently or the circuit is open.
     """
     if source == target:
         return text
 
+    if _negative_cache().get((text, source, target)) is not None:
+        return None
+    if not _allow(source, target):
+        logger.debug("LibreTranslate circuit open, skipping %r (%s->%s)", text, source, target)
+        return None
+
     url = f"{settings.LIBRETRANSLATE_URL}/translate"
     payload = {
         "q": text,
@@ -27,14 +242,75 @@ def translate_text(text: str, source: str, target: str) -> str | None:
     logger.info("Translation request: %r (%s -> %s)", text, source, target)
 
     try:
-        response = requests.post(url, json=payload, timeout=10)
+        response = get_session().post(url, json=payload, timeout=get_timeout())
         response.raise_for_status()
         data = response.json()
-        translated = data.get("translatedText")
-        logger.info("Translation response: %r -> %r", text, translated)
-        return translated
-    except requests.RequestException:
-        logger.exception(
-            "LibreTranslate request failed for %r (%s->%s)", text, source, target
+    except (requests.RequestException, ValueError) as exc:
+        logger.warning(
+            "LibreTranslate request failed for %r (%s->%s): %s", text, source, target, exc
         )
+        _record(source, target, error=exc, texts=[text])
         return None
+
+    _record(source, target)
+    translated = data.get("translatedText")
+    logger.info("Translation response: %r -> %r", text, translated)
+    return translated
+
+
+def translate_texts(texts: list[str], source: str, target: str) -> dict[str, str]:
+    """Translate several *texts* from *source* to *target* in as few calls as possible.
+
+    Identical strings are sent only once, and the unique strings are posted in
+    chunks of ``LIBRETRANSLATE_BATCH_SIZE`` using LibreTranslate's array form of
+    ``q``.  Returns a mapping of original text to translated text; texts whose
+    chunk failed, that failed recently, or that were refused by an open
+    circuit are simply missing from the result.
+    """
+    unique = list(dict.fromkeys(texts))
+    if source == target:
+        return {text: text for text in unique}
+
+    failed = _negative_cache()
+    unique = [text for text in unique if failed.get((text, source, target)) is None]
+
+    url = f"{settings.LIBRETRANSLATE_URL}/translate"
+    batch_size = settings.LIBRETRANSLATE_BATCH_SIZE
+    result = {}
+
+    for start in range(0, len(unique), batch_size):
+        chunk = unique[start:start + batch_size]
+        if not _allow(source, target):
+            logger.debug(
+                "LibreTranslate circuit open, skipping %d text(s) (%s->%s)",
+                len(unique) - start, source, target,
+            )
+            break
+
+        payload = {
+            "q": chunk,
+            "source": source,
+            "target": target,
+            "format": "text",
+        }
+
+        logger.info("Batch translation request: %d text(s) (%s -> %s)", len(chunk), source, target)
+
+        try:
+            response = get_session().post(url, json=payload, timeout=get_timeout())
+            response.raise_for_status()
+            translated = response.json().get("translatedText")
+            if not isinstance(translated, list) or len(translated) != len(chunk):
+                raise ValueError(f"unexpected batch response: {translated!r}")
+        except (requests.RequestException, ValueError) as exc:
+            logger.warning(
+                "LibreTranslate batch request failed for %d text(s) (%s->%s): %s",
+                len(chunk), source, target, exc,
+            )
+            _record(source, target, error=exc, texts=chunk)
+            continue
+
+        _record(source, target)
+        result.update(zip(chunk, translated))
+
+    return result
@@ -0,0 +1,184 @@
+"""A local stand-in for LibreTranslate, for tests, benchmarks and offline development.
+
+It implements ``POST /translate`` (with string or array ``q``),
+``GET /languages`` and ``GET /health`` with a deterministic pseudo-translation,
+and can simulate latency, random failures and a throughput cap.  Start it
+with the ``run_fake_libretranslate`` management command, or in-process::
+
+    with running_fake_libretranslate(latency=0.05) as server:
+        settings.LIBRETRANSLATE_URL = server.url
+"""
+
+import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+DEFAULT_LANGUAGES = {
+    "en": "English",
+    "ru": "Russian",
+    "fr": "French",
+    "es": "Spanish",
+}
+
+
+def pseudo_translate(text: str, target: str) -> str:
+    """Return the deterministic fake translation of *text* into *target*."""
+    return f"[{target}] {text}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        if self.path.rstrip("/") == "/languages":
+            codes = list(server.languages)
+            self._send_json(
+                200,
+                [
+                    {
+                        "code": code,
+                        "name": name,
+                        "targets": [other for other in codes if other != code],
+                    }
+                    for code, name in server.languages.items()
+                ],
+            )
+        elif self.path.rstrip("/") == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        server = self.server
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path.rstrip("/") != "/translate":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        server.count_request()
+        if not server.take_token():
+            self._send_json(429, {"error": "Too many requests"})
+            return
+        server.delay()
+        if server.error_rate and server.random.random() < server.error_rate:
+            self._send_json(503, {"error": "Simulated failure"})
+            return
+
+        try:
+            if "json" in (self.headers.get("Content-Type") or ""):
+                data = json.loads(body or b"{}")
+            else:
+                data = {key: values[-1] for key, values in parse_qs(body.decode()).items()}
+        except ValueError:
+            self._send_json(400, {"error": "Invalid request body"})
+            return
+
+        q, source, target = data.get("q"), data.get("source"), data.get("target")
+        if q is None or not source or not target:
+            self._send_json(400, {"error": "Missing q, source or target"})
+            return
+        if target not in server.languages or (source != "auto" and source not in server.languages):
+            self._send_json(400, {"error": f"{source}->{target} is not supported"})
+            return
+
+        if isinstance(q, list):
+            translated = [pseudo_translate(text, target) for text in q]
+        else:
+            translated = pseudo_translate(q, target)
+        self._send_json(200, {"translatedText": translated})
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class FakeLibreTranslate(ThreadingHTTPServer):
+    """Threaded HTTP server speaking the subset of the LibreTranslate API we use.
+
+    *latency* (plus up to *jitter*) seconds are added to every translation,
+    *error_rate* is the share of translations answered with a 503, and
+    *max_rps* caps accepted translations per second (excess requests get a
+    429).  *seed* makes the simulated failures reproducible.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, *, languages=None, latency=0.0,
+                 jitter=0.0, error_rate=0.0, max_rps=0.0, seed=None):
+        super().__init__((host, port), _Handler)
+        self.languages = dict(languages or DEFAULT_LANGUAGES)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.max_rps = max_rps
+        self.random = random.Random(seed)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._tokens = max_rps
+        self._refilled_at = time.monotonic()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def take_token(self) -> bool:
+        """Token bucket for the throughput cap; always allows when uncapped."""
+        if not self.max_rps:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.max_rps, self._tokens + (now - self._refilled_at) * self.max_rps
+            )
+            self._refilled_at = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def delay(self):
+        with self._lock:
+            pause = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if pause:
+            time.sleep(pause)
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+@contextmanager
+def running_fake_libretranslate(**options):
+    """Run a :class:`FakeLibreTranslate` on a free port for the duration of the block."""
+    server = FakeLibreTranslate(**options).start()
+    try:
+        yield server
+    finally:
+        server.stop()
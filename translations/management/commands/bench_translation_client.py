@@ -0,0 +1,83 @@
+"""Management command to compare pooled and unpooled requests to LibreTranslate."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+from translations.client import get_session, get_timeout
+from translations.fake_server import running_fake_libretranslate
+
+MODES = ("unpooled", "pooled")
+
+
+class Command(BaseCommand):
+    help = (
+        "Send translation requests to the bundled fake LibreTranslate server, once "
+        "through the pooled keep-alive session of translations.client and once with "
+        "a new connection per request, and report the throughput of both."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Requests sent per mode and concurrency (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 8],
+            help="Numbers of threads sending requests at once (default: 1 8)",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.0,
+            help="Seconds the fake server adds to every translation (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        if options["requests"] < 1 or min(options["concurrency"]) < 1:
+            raise CommandError("--requests and --concurrency must be at least 1.")
+
+        with running_fake_libretranslate(latency=options["latency"]) as server:
+            url = f"{server.url}/translate"
+            send = {
+                "unpooled": lambda payload: requests.post(url, json=payload, timeout=get_timeout()),
+                "pooled": lambda payload: get_session().post(url, json=payload, timeout=get_timeout()),
+            }
+            self.stdout.write(f"{'threads':>7} {'mode':<9} {'total':>9} {'req/s':>9} {'speedup':>8}")
+            for concurrency in options["concurrency"]:
+                timings = {}
+                for mode in MODES:
+                    timings[mode] = self._run(send[mode], options["requests"], concurrency)
+                    self.stdout.write(
+                        f"{concurrency:>7} {mode:<9} {timings[mode]:>8.3f}s "
+                        f"{options['requests'] / timings[mode]:>9.0f} "
+                        f"{timings['unpooled'] / timings[mode]:>7.1f}x"
+                    )
+
+        self.stdout.write(self.style.SUCCESS("Done."))
+
+    @staticmethod
+    def _run(send, count, concurrency):
+        """Return the seconds taken to send *count* requests from *concurrency* threads."""
+        payloads = [
+            {"q": f"Item {n}", "source": "en", "target": "fr", "format": "text"}
+            for n in range(count)
+        ]
+
+        def post(payload):
+            response = send(payload)
+            if response.status_code != 200:
+                raise CommandError(f"The fake server answered {response.status_code}.")
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # list() re-raises the first failure.
+            list(executor.map(post, payloads))
+        return time.perf_counter() - started
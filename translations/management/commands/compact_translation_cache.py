@@ -0,0 +1,114 @@
+"""Management command to evict orphaned and cold translation cache rows."""
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from lists.models import TranslationCache
+from translations.cache import translation_cache
+from translations.services import get_target_languages
+
+
+class Command(BaseCommand):
+    help = (
+        "Evict translation cache rows nobody needs any more (archived lists, "
+        "languages no member uses) and the least recently used rows beyond "
+        "TRANSLATION_CACHE_MAX_ROWS."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-rows",
+            type=int,
+            default=None,
+            help="Row limit to enforce (default: TRANSLATION_CACHE_MAX_ROWS, 0 = unbounded)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Rows examined or deleted per statement (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.05,
+            help="Seconds to sleep between chunks to spare the database (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be evicted without deleting anything.",
+        )
+
+    def handle(self, *args, **options):
+        max_rows = options["max_rows"]
+        if max_rows is None:
+            max_rows = settings.TRANSLATION_CACHE_MAX_ROWS
+
+        orphaned = self._evict_orphaned(options)
+        self.stdout.write(f"Orphaned rows evicted: {orphaned}")
+
+        cold = self._evict_cold(max_rows, orphaned, options) if max_rows else 0
+        self.stdout.write(f"Cold rows evicted: {cold}")
+
+        verb = "would be evicted" if options["dry_run"] else "evicted"
+        self.stdout.write(self.style.SUCCESS(f"Done. {orphaned + cold} row(s) {verb}."))
+
+    def _evict_orphaned(self, options) -> int:
+        """Evict rows for archived lists or target languages no member uses."""
+        evicted = 0
+        last_pk = 0
+        while True:
+            rows = list(
+                TranslationCache.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list(
+                    "pk", "item_id", "source_language", "target_language",
+                    "item__list_id", "item__list__is_archived",
+                )[: options["chunk_size"]]
+            )
+            if not rows:
+                return evicted
+            last_pk = rows[-1][0]
+
+            languages = get_target_languages({row[4] for row in rows})
+            doomed = [
+                row for row in rows
+                if row[5] or row[3] not in languages.get(row[4], ())
+            ]
+            evicted += self._delete(doomed, options)
+
+    def _evict_cold(self, max_rows: int, orphaned: int, options) -> int:
+        """Evict least recently accessed rows until at most *max_rows* remain."""
+        excess = TranslationCache.objects.count() - max_rows
+        if options["dry_run"]:
+            # Orphaned rows were only counted, not deleted.
+            return max(excess - orphaned, 0)
+
+        evicted = 0
+        while excess > 0:
+            rows = list(
+                TranslationCache.objects.order_by("last_accessed_at", "pk").values_list(
+                    "pk", "item_id", "source_language", "target_language"
+                )[: min(excess, options["chunk_size"])]
+            )
+            if not rows:
+                break
+            deleted = self._delete(rows, options)
+            evicted += deleted
+            excess -= deleted
+        return evicted
+
+    def _delete(self, rows, options) -> int:
+        """Delete *rows* by primary key and drop them from the shared tiers."""
+        if not rows:
+            return 0
+        if options["dry_run"]:
+            return len(rows)
+
+        deleted, _ = TranslationCache.objects.filter(pk__in=[row[0] for row in rows]).delete()
+        translation_cache.delete_many((row[1], row[2], row[3]) for row in rows)
+        time.sleep(options["pause"])
+        return deleted
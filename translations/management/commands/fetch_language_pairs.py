@@ -1,70 +1,154 @@
 """Management command to download language pairs from LibreTranslate."""
 
+import json
+
 import requests
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
+from translations.client import get_session
 from translations.models import LanguagePair
+from translations.pairs import invalidate_language_index
 
 LIBRETRANSLATE_LANGUAGES_URL = "https://libretranslate.com/languages"
 
 
 class Command(BaseCommand):
-    help = "Download supported language pairs from LibreTranslate and store them in the database."
+    help = (
+        "Download supported language pairs from LibreTranslate and sync them into the "
+        "database in one transaction."
+    )
 
     def add_arguments(self, parser):
-        parser.add_argument(
+        source = parser.add_mutually_exclusive_group()
+        source.add_argument(
             "--url",
             default=LIBRETRANSLATE_LANGUAGES_URL,
             help="URL of the LibreTranslate /languages endpoint (default: %(default)s)",
         )
+        source.add_argument(
+            "--local",
+            action="store_true",
+            help="Fetch /languages from the configured LIBRETRANSLATE_URL instead.",
+        )
+        source.add_argument(
+            "--file",
+            help="Read a saved /languages JSON response from this file instead of fetching it.",
+        )
         parser.add_argument(
             "--clear",
             action="store_true",
             help="Remove all existing language pairs before importing.",
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changes that would be made without writing them.",
+        )
 
     def handle(self, *args, **options):
-        url = options["url"]
-
-        self.stdout.write(f"Fetching languages from {url} ...")
-        try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-        except requests.RequestException as exc:
-            self.stderr.write(self.style.ERROR(f"Failed to fetch languages: {exc}"))
+        languages = self._load_languages(options)
+        if languages is None:
             return
 
-        languages = response.json()
-
         # Build a lookup of code -> name for resolving target names
         name_by_code = {lang["code"]: lang["name"] for lang in languages}
-
-        if options["clear"]:
-            deleted, _ = LanguagePair.objects.all().delete()
-            self.stdout.write(f"Cleared {deleted} existing language pair(s).")
-
-        created = 0
-        skipped = 0
+        wanted = {}
         for lang in languages:
-            source_code = lang["code"]
-            source_name = lang["name"]
             for target_code in lang.get("targets", []):
-                target_name = name_by_code.get(target_code, target_code)
-                _, was_created = LanguagePair.objects.update_or_create(
-                    source_code=source_code,
-                    target_code=target_code,
-                    defaults={
-                        "source_name": source_name,
-                        "target_name": target_name,
-                    },
+                wanted[(lang["code"], target_code)] = (
+                    lang["name"],
+                    name_by_code.get(target_code, target_code),
                 )
-                if was_created:
-                    created += 1
-                else:
-                    skipped += 1
-
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Done. Created {created} new pair(s), updated {skipped} existing pair(s)."
-            )
+
+        dry_run = options["dry_run"]
+        with transaction.atomic():
+            existing = {
+                (pair.source_code, pair.target_code): pair
+                for pair in LanguagePair.objects.select_for_update()
+            }
+            if options["clear"]:
+                cleared = len(existing)
+                if not dry_run:
+                    LanguagePair.objects.all().delete()
+                existing = {}
+                self.stdout.write(f"Cleared {cleared} existing language pair(s).")
+
+            to_create = []
+            to_update = []
+            for (source_code, target_code), (source_name, target_name) in wanted.items():
+                pair = existing.get((source_code, target_code))
+                if pair is None:
+                    to_create.append(
+                        LanguagePair(
+                            source_code=source_code,
+                            source_name=source_name,
+                            target_code=target_code,
+                            target_name=target_name,
+                        )
+                    )
+                elif (pair.source_name, pair.target_name) != (source_name, target_name):
+                    pair.source_name = source_name
+                    pair.target_name = target_name
+                    to_update.append(pair)
+            to_delete = [pair for key, pair in existing.items() if key not in wanted]
+
+            if options["verbosity"] >= 2 or dry_run:
+                for label, pairs in (("+", to_create), ("~", to_update), ("-", to_delete)):
+                    for pair in pairs:
+                        self.stdout.write(f"  {label} {pair.source_code} -> {pair.target_code}")
+
+            if not dry_run:
+                LanguagePair.objects.bulk_create(to_create, batch_size=500)
+                LanguagePair.objects.bulk_update(
+                    to_update, ["source_name", "target_name"], batch_size=500
+                )
+                LanguagePair.objects.filter(pk__in=[pair.pk for pair in to_delete]).delete()
+                # Bulk writes bypass the model signals that refresh the pair index.
+                transaction.on_commit(invalidate_language_index)
+
+        summary = (
+            f"{len(to_create)} new pair(s), {len(to_update)} updated, "
+            f"{len(to_delete)} removed, "
+            f"{len(wanted) - len(to_create) - len(to_update)} unchanged."
         )
+        if dry_run:
+            self.stdout.write(f"Dry run: would apply {summary}")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Done. Applied {summary}"))
+
+    def _load_languages(self, options):
+        """Return the parsed ``/languages`` payload, or ``None`` after reporting an error."""
+        if options["file"]:
+            self.stdout.write(f"Reading languages from {options['file']} ...")
+            try:
+                with open(options["file"], encoding="utf-8") as fh:
+                    languages = json.load(fh)
+            except (OSError, ValueError) as exc:
+                self.stderr.write(self.style.ERROR(f"Failed to read languages: {exc}"))
+                return None
+        else:
+            if options["local"]:
+                url = f"{settings.LIBRETRANSLATE_URL}/languages"
+            else:
+                url = options["url"]
+            self.stdout.write(f"Fetching languages from {url} ...")
+            try:
+                response = get_session().get(
+                    url, timeout=(settings.LIBRETRANSLATE_CONNECT_TIMEOUT, 30)
+                )
+                response.raise_for_status()
+                languages = response.json()
+            except (requests.RequestException, ValueError) as exc:
+                self.stderr.write(self.style.ERROR(f"Failed to fetch languages: {exc}"))
+                return None
+
+        if not isinstance(languages, list) or not all(
+            isinstance(lang, dict) and "code" in lang and "name" in lang for lang in languages
+        ):
+            self.stderr.write(
+                self.style.ERROR("Unexpected /languages payload: expected a list of languages.")
+            )
+            return None
+        return languages
@@ -0,0 +1,67 @@
+"""Management command to run the bundled LibreTranslate stand-in server."""
+
+from django.core.management.base import BaseCommand
+
+from translations.fake_server import DEFAULT_LANGUAGES, FakeLibreTranslate
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a local fake LibreTranslate server with deterministic pseudo-translations "
+        "and configurable latency, error rate and throughput."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: %(default)s)")
+        parser.add_argument("--port", type=int, default=5000, help="Port (default: %(default)s)")
+        parser.add_argument(
+            "--languages",
+            default=",".join(DEFAULT_LANGUAGES),
+            help="Comma-separated language codes to offer (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.0,
+            help="Seconds added to every translation (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--jitter",
+            type=float,
+            default=0.0,
+            help="Extra random latency of up to this many seconds (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--error-rate",
+            type=float,
+            default=0.0,
+            help="Share of translations answered with HTTP 503, 0-1 (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--max-rps",
+            type=float,
+            default=0.0,
+            help="Translations accepted per second before HTTP 429, 0 for no cap (default: %(default)s)",
+        )
+        parser.add_argument("--seed", type=int, default=None, help="Random seed for simulated failures.")
+
+    def handle(self, *args, **options):
+        codes = [code.strip() for code in options["languages"].split(",") if code.strip()]
+        server = FakeLibreTranslate(
+            options["host"],
+            options["port"],
+            languages={code: DEFAULT_LANGUAGES.get(code, code) for code in codes},
+            latency=options["latency"],
+            jitter=options["jitter"],
+            error_rate=options["error_rate"],
+            max_rps=options["max_rps"],
+            seed=options["seed"],
+        )
+        self.stdout.write(f"Fake LibreTranslate listening on {server.url} (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        self.stdout.write(self.style.SUCCESS(f"Stopped after {server.requests} translation request(s)."))
@@ -0,0 +1,90 @@
+"""Management command that processes the background translation queue."""
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from translations.client import is_backend_unavailable
+from translations.queue import claim_jobs, process_jobs
+
+
+class Command(BaseCommand):
+    help = "Process queued translation jobs and fill the translation cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of jobs to claim at a time (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Number of target languages translated in parallel (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait when the queue is empty (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=5,
+            help="Attempts before a job is marked failed (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--stale-after",
+            type=int,
+            default=300,
+            help="Seconds after which a running job is considered abandoned (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the queue once and exit instead of polling forever.",
+        )
+
+    def handle(self, *args, **options):
+        stale_after = timedelta(seconds=options["stale_after"])
+        self.stdout.write("Translation worker started.")
+
+        try:
+            while True:
+                if is_backend_unavailable():
+                    # Leave jobs queued (and their attempts untouched) until
+                    # the circuit lets a probe through again.  Jobs whose
+                    # texts are negative-cached are deferred the same way by
+                    # process_jobs and not claimed until the entry expires.
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                jobs = claim_jobs(options["batch_size"], stale_after)
+                if not jobs:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                done, failed = process_jobs(
+                    jobs, options["concurrency"], options["max_attempts"]
+                )
+                self.stdout.write(
+                    f"Processed {len(jobs)} job(s): {done} done, {failed} failed, "
+                    f"{len(jobs) - done - failed} re-queued."
+                )
+                if not done and not options["once"]:
+                    # LibreTranslate is probably unavailable; don't spin.
+                    time.sleep(options["poll_interval"])
+                elif not done:
+                    break
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS("Translation worker stopped."))
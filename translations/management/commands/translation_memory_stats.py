@@ -0,0 +1,47 @@
+"""Management command to report how many LibreTranslate calls the translation memory saves."""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Sum
+
+from translations.models import TranslationMemory
+
+
+class Command(BaseCommand):
+    help = "Report translation memory size and hit rate, overall and per language pair."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=10,
+            help="Number of language pairs to list (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        totals = TranslationMemory.objects.aggregate(entries=Count("pk"), hits=Sum("hit_count"))
+        entries = totals["entries"]
+        hits = totals["hits"] or 0
+
+        self.stdout.write(f"Entries: {entries}")
+        self.stdout.write(f"LibreTranslate calls saved: {hits}")
+        self.stdout.write(f"Hit rate: {_rate(hits, entries)}")
+
+        pairs = (
+            TranslationMemory.objects.values("source_language", "target_language")
+            .annotate(entries=Count("pk"), hits=Sum("hit_count"))
+            .order_by("-hits")[: options["top"]]
+        )
+        if pairs:
+            self.stdout.write("")
+            self.stdout.write("Pair       Entries       Hits   Hit rate")
+            for pair in pairs:
+                label = f"{pair['source_language']}->{pair['target_language']}"
+                self.stdout.write(
+                    f"{label:<10} {pair['entries']:>7} {pair['hits']:>10} {_rate(pair['hits'], pair['entries']):>10}"
+                )
+
+
+def _rate(hits, entries):
+    """Share of lookups served from memory; each entry cost one API call."""
+    lookups = hits + entries
+    return f"{hits / lookups:.1%}" if lookups else "n/a"
@@ -0,0 +1,187 @@
+"""Management command to pre-populate the translation cache in bulk."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils import timezone
+
+from lists.models import ListItem, TranslationCache
+from translations.services import get_target_languages, translate_items
+
+
+class RateLimiter:
+    """Allow at most *rate* calls per second across threads (0 disables the limit)."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self.next_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        time.sleep(max(0, start - now))
+
+
+class Command(BaseCommand):
+    help = (
+        "Translate list items into every language their list members use and "
+        "store the results in the translation cache."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--list",
+            type=int,
+            action="append",
+            dest="lists",
+            help="Only warm this list (may be repeated).",
+        )
+        parser.add_argument(
+            "--language",
+            action="append",
+            dest="languages",
+            help="Only warm this target language (may be repeated).",
+        )
+        parser.add_argument(
+            "--max-age-days",
+            type=int,
+            help="Only warm items created within this many days.",
+        )
+        parser.add_argument(
+            "--include-archived",
+            action="store_true",
+            help="Also warm items on archived lists.",
+        )
+        parser.add_argument(
+            "--after-id",
+            type=int,
+            default=0,
+            help="Resume after this item id (printed in the progress output).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Items per LibreTranslate batch (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="Batches translated in parallel (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=2.0,
+            help="Maximum batches started per second, 0 for no limit (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Items scanned per progress step (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many translations are missing.",
+        )
+
+    def handle(self, *args, **options):
+        items = ListItem.objects.filter(pk__gt=options["after_id"]).only(
+            "pk", "list_id", "text", "source_language"
+        )
+        if options["lists"]:
+            items = items.filter(list_id__in=options["lists"])
+        if options["max_age_days"] is not None:
+            items = items.filter(
+                created_at__gte=timezone.now() - timedelta(days=options["max_age_days"])
+            )
+        if not options["include_archived"]:
+            items = items.filter(list__is_archived=False)
+        items = items.order_by("pk")
+
+        total = items.count()
+        languages = set(options["languages"] or [])
+        limiter = RateLimiter(options["rate"])
+        scanned = missing_total = stored_total = 0
+
+        self.stdout.write(f"Scanning {total} item(s) ...")
+
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            last_pk = options["after_id"]
+            while True:
+                chunk = list(items.filter(pk__gt=last_pk)[: options["chunk_size"]])
+                if not chunk:
+                    break
+                last_pk = chunk[-1].pk
+                scanned += len(chunk)
+
+                batches = self._missing_batches(chunk, languages, options["batch_size"])
+                missing = sum(len(batch) for batch, _ in batches)
+                missing_total += missing
+
+                if not options["dry_run"]:
+                    futures = [
+                        executor.submit(self._translate_batch, limiter, batch, target)
+                        for batch, target in batches
+                    ]
+                    stored_total += sum(future.result() for future in futures)
+
+                self.stdout.write(
+                    f"[{scanned}/{total}] {missing} missing translation(s) in this chunk; "
+                    f"last item id {last_pk}"
+                )
+
+        if options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS(f"Done. {missing_total} translation(s) missing."))
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Done. Stored {stored_total} of {missing_total} missing translation(s)."
+                )
+            )
+
+    @staticmethod
+    def _missing_batches(chunk, languages, batch_size):
+        """Return ``(items, target)`` batches for translations members need but lack."""
+        targets_by_list = get_target_languages({item.list_id for item in chunk})
+        cached = set(
+            TranslationCache.objects.filter(item__in=chunk).values_list(
+                "item_id", "source_language", "target_language"
+            )
+        )
+
+        by_target = {}
+        for item in chunk:
+            for target in targets_by_list.get(item.list_id, ()):
+                if target == item.source_language or (languages and target not in languages):
+                    continue
+                if (item.pk, item.source_language, target) not in cached:
+                    by_target.setdefault(target, []).append(item)
+
+        return [
+            (group[start:start + batch_size], target)
+            for target, group in by_target.items()
+            for start in range(0, len(group), batch_size)
+        ]
+
+    @staticmethod
+    def _translate_batch(limiter, batch, target):
+        """Translate one batch and return how many translations were stored."""
+        limiter.wait()
+        try:
+            translate_items(batch, target)
+            return TranslationCache.objects.filter(item__in=batch, target_language=target).count()
+        finally:
+            connection.close()
@@ -0,0 +1,66 @@
+"""Content-addressed translation memory shared across items and lists."""
+
+import hashlib
+import unicodedata
+
+from django.db.models import F
+
+from .models import TranslationMemory
+
+
+def normalize_text(text: str) -> str:
+    """Normalize *text* for memory lookups.
+
+    Applies Unicode NFC normalization, strips the ends and collapses inner
+    whitespace.  Case is kept, since it can change the translation.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def memory_key(text: str, source: str, target: str) -> str:
+    """Return the memory key for *text* translated from *source* to *target*."""
+    raw = f"{source}\x1f{target}\x1f{normalize_text(text)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def recall(texts, source: str, target: str) -> dict[str, str]:
+    """Return remembered translations for *texts* as a text -> translation mapping.
+
+    Texts without an entry are missing from the result.  Every entry found
+    has its ``hit_count`` incremented, which feeds the hit-rate report.
+    """
+    keys = {}
+    for text in texts:
+        keys.setdefault(memory_key(text, source, target), []).append(text)
+    if not keys:
+        return {}
+
+    found = dict(
+        TranslationMemory.objects.filter(key__in=keys).values_list("key", "translated_text")
+    )
+    if found:
+        TranslationMemory.objects.filter(key__in=found).update(hit_count=F("hit_count") + 1)
+
+    return {
+        text: translated
+        for key, translated in found.items()
+        for text in keys[key]
+    }
+
+
+def remember(translations: dict[str, str], source: str, target: str) -> None:
+    """Store freshly translated *translations* (text -> translation) in the memory."""
+    entries = {}
+    for text, translated in translations.items():
+        key = memory_key(text, source, target)
+        entries.setdefault(
+            key,
+            TranslationMemory(
+                key=key,
+                source_language=source,
+                target_language=target,
+                source_text=normalize_text(text),
+                translated_text=translated,
+            ),
+        )
+    TranslationMemory.objects.bulk_create(entries.values(), ignore_conflicts=True)
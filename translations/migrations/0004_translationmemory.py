@@ -0,0 +1,71 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:04
+
+import hashlib
+import unicodedata
+
+from django.db import migrations, models
+
+
+def backfill_memory(apps, schema_editor):
+    """Seed the translation memory from existing per-item cache rows."""
+    TranslationCache = apps.get_model("lists", "TranslationCache")
+    TranslationMemory = apps.get_model("translations", "TranslationMemory")
+
+    entries = {}
+    rows = TranslationCache.objects.values_list(
+        "item__text", "source_language", "target_language", "translated_text"
+    ).order_by("created_at")
+    for text, source, target, translated in rows.iterator():
+        normalized = " ".join(unicodedata.normalize("NFC", text).split())
+        raw = f"{source}\x1f{target}\x1f{normalized}"
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+        entries.setdefault(
+            key,
+            TranslationMemory(
+                key=key,
+                source_language=source,
+                target_language=target,
+                source_text=normalized,
+                translated_text=translated,
+            ),
+        )
+
+    TranslationMemory.objects.bulk_create(
+        entries.values(), batch_size=500, ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("lists", "0007_alter_listitem_source_language"),
+        ("translations", "0003_translationjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationMemory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=64, unique=True)),
+                ("source_language", models.CharField(max_length=10)),
+                ("target_language", models.CharField(max_length=10)),
+                ("source_text", models.CharField(max_length=500)),
+                ("translated_text", models.CharField(max_length=500)),
+                ("hit_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name_plural": "translation memory",
+            },
+        ),
+        migrations.RunPython(backfill_memory, reverse_code=migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0004_translationmemory"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TranslationLease",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=100, unique=True)),
+                ("token", models.CharField(max_length=32)),
+                ("expires_at", models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0005_translationlease"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="languagepair",
+            constraint=models.UniqueConstraint(
+                fields=("source_code", "target_code"), name="unique_language_pair"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="languagepair",
+            unique_together=set(),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 01:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("translations", "0006_languagepair_unique_constraint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="translationjob",
+            name="run_after",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
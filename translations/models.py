@@ -11,22 +11,17 @@ class LanguagePair(models.Model):
     enabled = models.BooleanField(default=False)
 
     class Meta:
-        unique_together = ("source_code", "target_code")
         ordering = ["source_name", "target_name"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source_code", "target_code"], name="unique_language_pair"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.source_name} ({self.source_code}) -> {self.target_name} ({self.target_code})"
 
 
-def _local_name(code, fallback):
-    """Return the language's own-script name via Django, falling back to *fallback*."""
-    try:
-        from django.utils.translation import get_language_info
-        return get_language_info(code)["name_local"]
-    except KeyError:
-        return fallback
-
-
 def get_enabled_language_choices():
     """Return a list of (code, name) tuples for all languages in enabled pairs.
 
@@ -35,21 +30,95 @@ def get_enabled_language_choices():
     own locale (e.g. "Русский" for Russian) using Django's language metadata,
     falling back to the name stored in the model when Django doesn't recognise
     the code.  The result is sorted by name and always includes English as a
-    fallback when no pairs are enabled yet.
+    fallback when no pairs are enabled yet.  Served from the cached
+    ``translations.pairs`` index, so repeated calls cost no queries.
+    """
+    from .pairs import get_language_index
+
+    return list(get_language_index().choices)
+
+
+class TranslationJob(models.Model):
+    """A queued request to pre-translate an item for every language its list needs.
+
+    Jobs are created when items, collaborators or language preferences change
+    and are processed by the ``run_translation_worker`` management command.
+    At most one pending job exists per item; a job covers whatever target
+    languages the list's members use at the time it runs.  A pending job is
+    not claimed before ``run_after`` (when set).
     """
-    enabled_pairs = LanguagePair.objects.filter(enabled=True)
-
-    codes = set()
-    fallback_names = {}
-    for code, name in enabled_pairs.values_list("source_code", "source_name"):
-        codes.add(code)
-        fallback_names.setdefault(code, name)
-    for code, name in enabled_pairs.values_list("target_code", "target_name"):
-        codes.add(code)
-        fallback_names.setdefault(code, name)
-
-    if not codes:
-        return [("en", "English")]
-
-    languages = {code: _local_name(code, fallback_names[code]) for code in codes}
-    return sorted(languages.items(), key=lambda item: item[1])
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    item = models.ForeignKey(
+        "lists.ListItem",
+        on_delete=models.CASCADE,
+        related_name="translation_jobs",
+    )
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    run_after = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["item"],
+                condition=models.Q(status="pending"),
+                name="unique_pending_translation_job",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"Translate item {self.item_id} ({self.status})"
+
+
+class TranslationMemory(models.Model):
+    """A translation shared by every item with the same text and language pair.
+
+    Rows are keyed by a hash of the language pair and the normalized source
+    text (see ``translations.memory``), so "milk" is translated once for all
+    lists and the entry outlives the items that produced it.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    source_language = models.CharField(max_length=10)
+    target_language = models.CharField(max_length=10)
+    source_text = models.CharField(max_length=500)
+    translated_text = models.CharField(max_length=500)
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name_plural = "translation memory"
+
+    def __str__(self):
+        return f"{self.source_text} -> {self.translated_text} ({self.source_language}->{self.target_language})"
+
+
+class TranslationLease(models.Model):
+    """A short-lived claim on a unit of translation work, shared by all workers.
+
+    Used by ``translations.singleflight`` so that identical translation
+    requests arriving in different gunicorn workers call LibreTranslate once.
+    """
+
+    key = models.CharField(max_length=100, unique=True)
+    token = models.CharField(max_length=32)
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,108 @@
+"""In-memory index of LibreTranslate language pairs.
+
+Built once per process from a single query and rebuilt only when the
+``LanguagePair`` table changes.  Changes made through the ORM bump a version
+stamp in the default cache (see ``translations.signals``); with a shared
+cache backend every worker notices on its next lookup.  As a safety net for
+per-process caches and raw SQL edits, an index older than
+``LANGUAGE_INDEX_MAX_AGE`` seconds is rebuilt as well.
+"""
+
+import threading
+import time
+import uuid
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_CACHE_KEY = "translations:language-pairs:version"
+
+
+class Pair(NamedTuple):
+    source_code: str
+    source_name: str
+    target_code: str
+    target_name: str
+
+
+def _local_name(code, fallback):
+    """Return the language's own-script name via Django, falling back to *fallback*."""
+    try:
+        from django.utils.translation import get_language_info
+        return get_language_info(code)["name_local"]
+    except KeyError:
+        return fallback
+
+
+class LanguagePairIndex:
+    """Adjacency and display data for every stored language pair."""
+
+    def __init__(self, rows):
+        self.targets = {}
+        self.enabled_targets = {}
+        self.enabled_pairs = []
+        fallback_names = {}
+
+        for source_code, source_name, target_code, target_name, enabled in rows:
+            self.targets.setdefault(source_code, set()).add(target_code)
+            if not enabled:
+                continue
+            self.enabled_targets.setdefault(source_code, set()).add(target_code)
+            self.enabled_pairs.append(Pair(source_code, source_name, target_code, target_name))
+            fallback_names.setdefault(source_code, source_name)
+            fallback_names.setdefault(target_code, target_name)
+
+        self.enabled_pairs.sort(key=lambda pair: (pair.source_name, pair.target_name))
+        self.enabled_pairs_by_source = {}
+        for pair in self.enabled_pairs:
+            self.enabled_pairs_by_source.setdefault(pair.source_code, []).append(pair)
+        self.enabled_sources = sorted(
+            {(pair.source_code, pair.source_name) for pair in self.enabled_pairs},
+            key=lambda source: source[1],
+        )
+
+        self.names = {code: _local_name(code, name) for code, name in fallback_names.items()}
+        self.choices = sorted(self.names.items(), key=lambda item: item[1]) or [("en", "English")]
+
+    def supports(self, source: str, target: str) -> bool:
+        """Return whether LibreTranslate offers *source* -> *target*.
+
+        Every pair is assumed to be available until the table has been
+        populated with ``fetch_language_pairs``.
+        """
+        if not self.targets:
+            return True
+        return target in self.targets.get(source, ())
+
+
+_index = None
+_index_version = None
+_index_built_at = 0.0
+_lock = threading.Lock()
+
+
+def get_language_index() -> LanguagePairIndex:
+    """Return the current language pair index, rebuilding it if it is stale."""
+    global _index, _index_version, _index_built_at
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        version = cache.get_or_set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
+    expired = time.monotonic() - _index_built_at > settings.LANGUAGE_INDEX_MAX_AGE
+
+    if _index is None or _index_version != version or expired:
+        from .models import LanguagePair
+
+        with _lock:
+            rows = LanguagePair.objects.values_list(
+                "source_code", "source_name", "target_code", "target_name", "enabled"
+            )
+            _index = LanguagePairIndex(rows)
+            _index_version = version
+            _index_built_at = time.monotonic()
+    return _index
+
+
+def invalidate_language_index() -> None:
+    """Mark every process's index stale; call after changing ``LanguagePair`` rows."""
+    cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, timeout=None)
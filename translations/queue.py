@@ -0,0 +1,193 @@
+"""Background translation queue.
+
+Views enqueue jobs as soon as new translation work exists; the
+``run_translation_worker`` management command claims them in batches and
+fills the TranslationCache so most list views find a warm cache.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from lists.models import Collaborator, List, ListItem, TranslationCache
+
+from .client import is_translation_unavailable
+from .models import TranslationJob
+from .pairs import get_language_index
+from .services import get_target_languages, translate_items
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_items(items):
+    """Queue translation jobs for *items*, skipping items already pending."""
+    jobs = [TranslationJob(item=item) for item in items]
+    TranslationJob.objects.bulk_create(jobs, ignore_conflicts=True)
+
+
+def enqueue_list(lst):
+    """Queue every item of *lst*, e.g. after a collaborator joins."""
+    enqueue_items(ListItem.objects.filter(list=lst).only("pk"))
+
+
+def enqueue_user_lists(user):
+    """Queue every item on the active lists *user* belongs to.
+
+    Used when the user changes their preferred language.
+    """
+    lists = List.objects.filter(
+        Q(owner=user) | Q(pk__in=Collaborator.objects.filter(user=user).values("list_id")),
+        is_archived=False,
+    )
+    enqueue_items(ListItem.objects.filter(list__in=lists).only("pk"))
+
+
+def due_jobs(now):
+    """Return pending jobs that may run at *now*, oldest first."""
+    return (
+        TranslationJob.objects.filter(status=TranslationJob.STATUS_PENDING)
+        .filter(Q(run_after__isnull=True) | Q(run_after__lte=now))
+        .order_by("created_at")
+    )
+
+
+def stale_jobs(before):
+    """Return jobs claimed before *before* and still running, oldest first."""
+    return TranslationJob.objects.filter(
+        status=TranslationJob.STATUS_RUNNING, claimed_at__lt=before
+    ).order_by("created_at")
+
+
+def claim_jobs(batch_size: int, stale_after: timedelta) -> list[TranslationJob]:
+    """Mark up to *batch_size* jobs as running and return them.
+
+    Jobs left running longer than *stale_after* (e.g. by a killed worker) are
+    claimed first, then pending jobs whose ``run_after`` has passed.  Each
+    query follows the ``(status, created_at)`` index.  On PostgreSQL rows
+    locked by another worker are skipped, so several workers can share the
+    queue.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            stale_jobs(now - stale_after).select_for_update(skip_locked=True)[:batch_size]
+        )
+        if len(jobs) < batch_size:
+            jobs += due_jobs(now).select_for_update(skip_locked=True)[:batch_size - len(jobs)]
+        TranslationJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            status=TranslationJob.STATUS_RUNNING,
+            claimed_at=now,
+            attempts=F("attempts") + 1,
+        )
+    for job in jobs:
+        job.status = TranslationJob.STATUS_RUNNING
+        job.claimed_at = now
+        job.attempts += 1
+    return jobs
+
+
+def _translate_group(items, target):
+    try:
+        translate_items(items, target)
+    finally:
+        connection.close()
+
+
+def process_jobs(jobs, concurrency: int, max_attempts: int) -> tuple[int, int]:
+    """Translate the items of *jobs* and settle the jobs.
+
+    Work is grouped by target language and the groups run concurrently on
+    *concurrency* threads; pairs LibreTranslate does not offer are skipped.
+    Jobs whose translations are all cached afterwards are deleted; the rest
+    are re-queued, or marked failed once they reach *max_attempts*.
+
+    Texts that would fail fast (negative-cached or behind an open circuit)
+    are not sent.  Their jobs are re-queued without using up an attempt and
+    deferred for ``TRANSLATION_NEGATIVE_CACHE_TTL`` seconds, so a transient
+    outage cannot fail jobs that never reached LibreTranslate.
+    Returns ``(done, failed)`` job counts.
+    """
+    items = {
+        item.pk: item
+        for item in ListItem.objects.filter(pk__in=[job.item_id for job in jobs])
+    }
+    targets_by_list = get_target_languages({item.list_id for item in items.values()})
+    index = get_language_index()
+
+    needed = {}
+    skipped = {}
+    by_target = {}
+    for item in items.values():
+        targets = {
+            target
+            for target in targets_by_list.get(item.list_id, ())
+            if target != item.source_language and index.supports(item.source_language, target)
+        }
+        needed[item.pk] = targets
+        for target in targets:
+            if is_translation_unavailable(item.text, item.source_language, target):
+                skipped.setdefault(item.pk, set()).add(target)
+            else:
+                by_target.setdefault(target, []).append(item)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [
+            executor.submit(_translate_group, group, target)
+            for target, group in by_target.items()
+        ]
+        for future in futures:
+            future.result()
+
+    cached = set(
+        TranslationCache.objects.filter(item_id__in=needed).values_list(
+            "item_id", "target_language"
+        )
+    )
+    done, retry, deferred, failed = [], [], [], []
+    for job in jobs:
+        missing = {
+            target
+            for target in needed.get(job.item_id, ())
+            if (job.item_id, target) not in cached
+        }
+        if not missing:
+            done.append(job.pk)
+        elif missing <= skipped.get(job.item_id, set()):
+            # Nothing was sent for this job; claiming it counted an attempt.
+            job.attempts -= 1
+            deferred.append(job)
+        elif job.attempts >= max_attempts:
+            failed.append(job.pk)
+        else:
+            retry.append(job)
+
+    TranslationJob.objects.filter(pk__in=done).delete()
+    TranslationJob.objects.filter(pk__in=failed).update(
+        status=TranslationJob.STATUS_FAILED,
+        last_error="Translation unavailable after %d attempts." % max_attempts,
+    )
+    # Re-queue as fresh pending rows; a newer pending job for the same item
+    # absorbs the retry.
+    run_after = timezone.now() + timedelta(seconds=settings.TRANSLATION_NEGATIVE_CACHE_TTL)
+    TranslationJob.objects.filter(pk__in=[job.pk for job in retry + deferred]).delete()
+    TranslationJob.objects.bulk_create(
+        [TranslationJob(item_id=job.item_id, attempts=job.attempts) for job in retry]
+        + [
+            TranslationJob(item_id=job.item_id, attempts=job.attempts, run_after=run_after)
+            for job in deferred
+        ],
+        ignore_conflicts=True,
+    )
+    if retry:
+        logger.warning("Re-queued %d translation job(s) after failures.", len(retry))
+    if deferred:
+        logger.info(
+            "Deferred %d translation job(s) whose texts failed recently.", len(deferred)
+        )
+
+    return len(done), len(failed)
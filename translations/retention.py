@@ -0,0 +1,55 @@
+"""Batched last-access tracking for ``TranslationCache`` rows.
+
+Reads only note which cached translations were used; the timestamps are
+written with one UPDATE per target language once enough accesses have
+piled up or the flush interval has passed.  ``compact_translation_cache``
+relies on them to find cold rows.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from lists.models import TranslationCache
+
+
+class AccessRecorder:
+    """Buffer ``(item_id, target_language)`` accesses and flush them in bulk."""
+
+    def __init__(self):
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def record(self, keys) -> None:
+        """Note accesses to ``(item_id, target_language)`` pairs."""
+        with self._lock:
+            self._pending.update(keys)
+            due = (
+                len(self._pending) >= settings.TRANSLATION_ACCESS_FLUSH_SIZE
+                or time.monotonic() - self._last_flush >= settings.TRANSLATION_ACCESS_FLUSH_INTERVAL
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered access times to the database."""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+
+        by_target = {}
+        for item_id, target in pending:
+            by_target.setdefault(target, []).append(item_id)
+        now = timezone.now()
+        for target, item_ids in by_target.items():
+            TranslationCache.objects.filter(
+                item_id__in=item_ids, target_language=target
+            ).update(last_accessed_at=now)
+
+
+access_recorder = AccessRecorder()
@@ -1,80 +1,247 @@
 """High-level translation helpers that use the cache."""
 
-from lists.models import ListItem, TranslationCache
+import hashlib
 
-from .client import translate_text
+from django.db.models import OuterRef, Subquery
+
+from lists.changes import record_changes
+from lists.models import Collaborator, List, ListChange, ListItem, TranslationCache
+
+from .cache import translation_cache
+from .client import is_translation_unavailable, translate_text, translate_texts
+from .memory import recall, remember
+from .pairs import get_language_index
+from .retention import access_recorder
+from .singleflight import coalesce, coalesce_local
 
 
 def get_translated_text(item: ListItem, target_language: str) -> str:
     """Return the item text translated into *target_language*.
 
-    Uses the TranslationCache to avoid repeated LibreTranslate calls.
-    Falls back to the original text if translation fails.
+    Uses the TranslationCache, then the shared translation memory, to avoid
+    repeated LibreTranslate calls.  Identical concurrent requests in this
+    process share one API call; no lease is taken, so the calling request
+    never waits on another worker.  Falls back to the original text if
+    translation fails.
     """
     if item.source_language == target_language:
         return item.text
 
-    # Check cache first
-    cached = TranslationCache.objects.filter(
-        item=item,
-        source_language=item.source_language,
-        target_language=target_language,
-    ).first()
-    if cached:
-        return cached.translated_text
-
-    # Call LibreTranslate
-    translated = translate_text(item.text, item.source_language, target_language)
-    if translated is None:
-        return item.text
+    source = item.source_language
+    cached = _cached_translations([item], source, target_language)
+    if item.pk in cached:
+        return cached[item.pk]
+
+    translated = coalesce_local(
+        f"item:{item.pk}:{source}:{target_language}",
+        lambda: _translate_and_store([item], source, target_language).get(item.pk),
+    )
+    return item.text if translated is None else translated
+
 
-    # Store in cache
-    TranslationCache.objects.create(
-        item=item,
-        source_language=item.source_language,
-        target_language=target_language,
-        translated_text=translated,
+def get_target_languages(list_ids) -> dict[int, set[str]]:
+    """Return the preferred languages of each list's members, keyed by list pk.
+
+    Covers owners and collaborators of every list in *list_ids* with two
+    queries regardless of how many lists are given.
+    """
+    languages = {}
+    owners = List.objects.filter(pk__in=list_ids).values_list(
+        "pk", "owner__preferred_language"
+    )
+    collaborators = Collaborator.objects.filter(list_id__in=list_ids).values_list(
+        "list_id", "user__preferred_language"
     )
-    return translated
+    for list_id, language in [*owners, *collaborators]:
+        languages.setdefault(list_id, set()).add(language)
+    return languages
+
+
+def translate_items(items, target_language: str) -> dict[int, str]:
+    """Translate many *items* into *target_language* with batched API calls.
+
+    Items are grouped by source language so each group needs a single
+    (array-form) LibreTranslate request.  Cached translations and the shared
+    translation memory are consulted first, new translations are stored in
+    both, and identical concurrent batches are coalesced.  Returns a mapping
+    of item pk to display text; items whose translation failed map to their
+    original text.
+    """
+    result = {}
+    by_source = {}
+    for item in items:
+        if item.source_language == target_language:
+            result[item.pk] = item.text
+        else:
+            by_source.setdefault(item.source_language, []).append(item)
+
+    for source, group in by_source.items():
+        cached = _cached_translations(group, source, target_language)
+        result.update(cached)
+
+        missing = [item for item in group if item.pk not in cached]
+        if not missing:
+            continue
+
+        pks = sorted(item.pk for item in missing)
+        digest = hashlib.sha1(",".join(map(str, pks)).encode()).hexdigest()
+        translated = coalesce(
+            f"batch:{source}:{target_language}:{digest}",
+            lambda: _translate_and_store(missing, source, target_language),
+            lambda: _stored_translations(missing, source, target_language, complete=True),
+        )
+        for item in missing:
+            result[item.pk] = translated.get(item.pk, item.text)
+
+    return result
+
 
+def _cached_translations(items, source: str, target_language: str) -> dict[int, str]:
+    """Return cached translations of *items* from the in-memory tiers or the table."""
+    tiered = translation_cache.get_many(
+        (item.pk, source, target_language) for item in items
+    )
+    cached = {item_id: text for (item_id, _, _), text in tiered.items()}
+    uncached = [item for item in items if item.pk not in cached]
+    if uncached:
+        cached.update(_stored_translations(uncached, source, target_language))
+    access_recorder.record((item_id, target_language) for item_id in cached)
+    return cached
 
-def get_items_for_user(lst, user) -> list[dict]:
-    """Return list items annotated with translated text for *user*.
 
-    Non-blocking: uses cached translations where available. Items that
-    need translation but have no cache entry are marked as pending so
-    the page can load immediately and fetch translations asynchronously.
+def _stored_translations(items, source: str, target_language: str, complete: bool = False):
+    """Read translations of *items* from the TranslationCache table.
 
-    Each dict contains: item, display_text, is_translated, translation_pending.
+    Found rows are copied into the in-memory tiers.  With *complete*, returns
+    ``None`` unless every item has a row (used when polling for another
+    worker's batch).
+    """
+    stored = dict(
+        TranslationCache.objects.filter(
+            item__in=items,
+            source_language=source,
+            target_language=target_language,
+        ).values_list("item_id", "translated_text")
+    )
+    translation_cache.set_many(
+        {(item_id, source, target_language): text for item_id, text in stored.items()}
+    )
+    if complete and len(stored) < len(items):
+        return None
+    return stored
+
+
+def _translate_and_store(items, source: str, target_language: str) -> dict[int, str]:
+    """Translate *items* via the memory or LibreTranslate and cache the results.
+
+    Returns translations keyed by item pk; failed items are omitted, as are
+    all items when LibreTranslate does not offer the language pair.
+    """
+    if not get_language_index().supports(source, target_language):
+        return {}
+
+    texts = [item.text for item in items]
+    translated = recall(texts, source, target_language)
+    unknown = [text for text in texts if text not in translated]
+    if unknown:
+        if len(unknown) == 1:
+            text = translate_text(unknown[0], source, target_language)
+            fresh = {} if text is None else {unknown[0]: text}
+        else:
+            fresh = translate_texts(unknown, source, target_language)
+        remember(fresh, source, target_language)
+        translated.update(fresh)
+
+    rows = [
+        TranslationCache(
+            item=item,
+            source_language=source,
+            target_language=target_language,
+            translated_text=translated[item.text],
+        )
+        for item in items
+        if item.text in translated
+    ]
+    # Upsert: a concurrent writer may have cached some of these meanwhile.
+    TranslationCache.objects.bulk_create(rows, ignore_conflicts=True)
+    # Rows rendered as pending can now be shown translated.
+    translated_by_list = {}
+    for row in rows:
+        translated_by_list.setdefault(row.item.list_id, []).append(row.item_id)
+    record_changes(ListChange.TRANSLATED, translated_by_list)
+    translation_cache.set_many(
+        {(row.item_id, source, target_language): row.translated_text for row in rows}
+    )
+    return {row.item_id: row.translated_text for row in rows}
+
+
+class ItemRow:
+    """One list item as displayed to a particular user."""
+
+    __slots__ = ("item", "display_text", "is_translated", "translation_pending")
+
+    def __init__(self, item, display_text, is_translated=False, translation_pending=False):
+        self.item = item
+        self.display_text = display_text
+        self.is_translated = is_translated
+        self.translation_pending = translation_pending
+
+    @classmethod
+    def translated(cls, item, display_text):
+        """Return a settled row for *item* showing *display_text*."""
+        return cls(item, display_text, is_translated=display_text != item.text)
+
+
+def with_cached_translations(items, user):
+    """Annotate the *items* queryset with ``cached_text`` for *user*'s language."""
+    cached_translation = TranslationCache.objects.filter(
+        item=OuterRef("pk"),
+        source_language=OuterRef("source_language"),
+        target_language=user.preferred_language,
+    ).values("translated_text")[:1]
+    return items.annotate(cached_text=Subquery(cached_translation))
+
+
+def item_rows(items, user) -> list[ItemRow]:
+    """Build display rows from items annotated by ``with_cached_translations``.
+
+    Non-blocking: items that need translation but have no cache entry are
+    marked as pending, so the page loads immediately and fetches
+    translations asynchronously, unless LibreTranslate does not offer the
+    language pair or is known to be failing for them, in which case the
+    original text is shown straight away.
     """
     target = user.preferred_language
+    index = get_language_index()
     result = []
-    for item in lst.items.select_related("added_by").all():
+    accessed = []
+    for item in items:
         if item.source_language == target:
-            result.append({
-                "item": item,
-                "display_text": item.text,
-                "is_translated": False,
-                "translation_pending": False,
-            })
+            result.append(ItemRow(item, item.text))
+        elif item.cached_text is not None:
+            accessed.append((item.pk, target))
+            result.append(ItemRow.translated(item, item.cached_text))
+        elif not index.supports(item.source_language, target) or is_translation_unavailable(
+            item.text, item.source_language, target
+        ):
+            result.append(ItemRow(item, item.text))
         else:
-            cached = TranslationCache.objects.filter(
-                item=item,
-                source_language=item.source_language,
-                target_language=target,
-            ).first()
-            if cached:
-                result.append({
-                    "item": item,
-                    "display_text": cached.translated_text,
-                    "is_translated": cached.translated_text != item.text,
-                    "translation_pending": False,
-                })
-            else:
-                result.append({
-                    "item": item,
-                    "display_text": item.text,
-                    "is_translated": False,
-                    "translation_pending": True,
-                })
+            result.append(ItemRow(item, item.text, translation_pending=True))
+    access_recorder.record(accessed)
     return result
+
+
+def get_item_row(item, user) -> ItemRow:
+    """Return a single *item* as displayed to *user*, without calling LibreTranslate.
+
+    Used when one row is re-rendered on its own.  An item whose translation
+    is not cached yet shows its original text rather than a placeholder,
+    since no translation stream will fill it in.
+    """
+    target = user.preferred_language
+    if item.source_language == target:
+        return ItemRow(item, item.text)
+    cached = _cached_translations([item], item.source_language, target)
+    if item.pk in cached:
+        return ItemRow.translated(item, cached[item.pk])
+    return ItemRow(item, item.text)
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import LanguagePair
+from .pairs import invalidate_language_index
+
+
+@receiver(post_save, sender=LanguagePair)
+@receiver(post_delete, sender=LanguagePair)
+def language_pair_changed(sender, **kwargs):
+    invalidate_language_index()
@@ -0,0 +1,129 @@
+"""Coalescing of identical in-flight translation requests.
+
+Concurrent callers asking for the same translation share one unit of work:
+threads in the same process wait for the leader's result.  Batch paths (the
+job worker, cache warming and translation streams) also coalesce across
+processes with ``coalesce``: they see a ``TranslationLease`` row and poll
+for the leader's output instead of calling LibreTranslate themselves.
+Ordinary request threads use ``coalesce_local``, which costs no queries and
+never polls.
+"""
+
+import secrets
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import TranslationLease
+
+
+class _Call:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Run a function at most once at a time per key within this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Return ``fn()``, or the result of an identical call already running."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+_flights = SingleFlight()
+
+
+def acquire_lease(key: str) -> str | None:
+    """Try to take the lease for *key*; return its token, or ``None`` if it is held."""
+    now = timezone.now()
+    TranslationLease.objects.filter(key=key, expires_at__lt=now).delete()
+    token = secrets.token_hex(16)
+    try:
+        with transaction.atomic():
+            TranslationLease.objects.create(
+                key=key,
+                token=token,
+                expires_at=now + timedelta(seconds=settings.TRANSLATION_LEASE_TIMEOUT),
+            )
+    except IntegrityError:
+        return None
+    return token
+
+
+def release_lease(key: str, token: str) -> None:
+    TranslationLease.objects.filter(key=key, token=token).delete()
+
+
+def coalesce(key: str, work, poll):
+    """Run *work* once for *key* across threads and processes and return its result.
+
+    *poll* is called by callers that lose the race for the lease; it should
+    return the leader's stored result, or ``None`` while it is not available.
+    If the leader gives up or the lease expires without a result, the waiter
+    does the work itself.  Waiters may block for up to
+    ``TRANSLATION_LEASE_TIMEOUT``, so this is meant for background work and
+    streams, not for requests awaiting a page.
+    """
+    return _flights.do(key, lambda: _run_with_lease(key, work, poll))
+
+
+def coalesce_local(key: str, work):
+    """Run *work* once for *key* among this process's threads and return its result.
+
+    Takes no lease: other processes may do the same work concurrently.
+    """
+    return _flights.do(key, work)
+
+
+def _run_with_lease(key, work, poll):
+    token = acquire_lease(key)
+    if token is None:
+        deadline = time.monotonic() + settings.TRANSLATION_LEASE_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(settings.TRANSLATION_LEASE_POLL_INTERVAL)
+            result = poll()
+            if result is not None:
+                return result
+            if not TranslationLease.objects.filter(key=key).exists():
+                break
+        result = poll()
+        if result is not None:
+            return result
+        token = acquire_lease(key)
+
+    try:
+        return work()
+    finally:
+        if token is not None:
+            release_lease(key, token)
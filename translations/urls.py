@@ -6,4 +6,5 @@ app_name = "translations"
 
 urlpatterns = [
     path("languages/", views.language_pairs, name="language_pairs"),
+    path("cache-stats/", views.cache_stats, name="cache_stats"),
 ]
@@ -1,23 +1,23 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
 from django.shortcuts import render
 
-from .models import LanguagePair
+from .cache import translation_cache
+from .pairs import get_language_index
 
 
 def language_pairs(request):
     """Display available LibreTranslate language pairs with source-language filtering."""
     source_filter = request.GET.get("source", "")
+    index = get_language_index()
 
-    pairs = LanguagePair.objects.filter(enabled=True)
     if source_filter:
-        pairs = pairs.filter(source_code=source_filter)
+        pairs = index.enabled_pairs_by_source.get(source_filter, [])
+    else:
+        pairs = index.enabled_pairs
 
     # Distinct source languages for the filter dropdown (enabled only)
-    source_languages = (
-        LanguagePair.objects.filter(enabled=True)
-        .values_list("source_code", "source_name")
-        .distinct()
-        .order_by("source_name")
-    )
+    source_languages = index.enabled_sources
 
     return render(
         request,
@@ -28,3 +28,9 @@ def language_pairs(request):
             "selected_source": source_filter,
         },
     )
+
+
+@staff_member_required
+def cache_stats(request):
+    """Report this worker's translation cache tier counters as JSON (staff only)."""
+    return JsonResponse(translation_cache.stats())